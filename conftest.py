@@ -0,0 +1,3 @@
+from tests.utils import PLUGIN_AUTOLOADED
+
+pytest_plugins = [] if PLUGIN_AUTOLOADED else ["qatoolbox.plugin"]
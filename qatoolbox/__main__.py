@@ -0,0 +1,5 @@
+import sys
+
+from qatoolbox.cli import main
+
+sys.exit(main())
@@ -0,0 +1,110 @@
+"""Command line interface for qatoolbox."""
+
+import argparse
+import configparser
+import json
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from qatoolbox.internal.config import (
+    common_ancestor,
+    find_ini_options,
+    read_ini_options,
+)
+from qatoolbox.internal.errors import ToolboxInvalidTestError
+from qatoolbox.lint import lint_paths
+from qatoolbox.markers.schema import RequirementSchema
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="qatoolbox", description="QA Toolbox utilities"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    lint = subparsers.add_parser(
+        "lint", help="Validate requirement IDs and metadata across a repository"
+    )
+    lint.add_argument(
+        "paths", nargs="*", default=["."], help="Files or directories to scan"
+    )
+    lint.add_argument(
+        "--config",
+        type=Path,
+        help="pytest configuration file holding the requirement schema "
+        "(default: discovered from the common ancestor of the paths, like "
+        "pytest)",
+    )
+    lint.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format (default: text)",
+    )
+    lint.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    return parser
+
+
+def _error(message: str) -> int:
+    print(f"qatoolbox: error: {message}", file=sys.stderr)
+    return 2
+
+
+def _run_lint(args: argparse.Namespace) -> int:
+    for path in args.paths:
+        if not Path(path).exists():
+            return _error(f"No such file or directory: {path}")
+    if args.config is not None:
+        if not args.config.is_file():
+            return _error(f"Configuration file not found: {args.config}")
+        try:
+            options = read_ini_options(args.config) or {}
+        except (OSError, ValueError, configparser.Error) as exc:
+            return _error(f"Cannot read {args.config}: {exc}")
+    else:
+        options = find_ini_options(common_ancestor(map(Path, args.paths)))
+    try:
+        schema = RequirementSchema.from_ini_options(options)
+    except ToolboxInvalidTestError as exc:
+        return _error(str(exc))
+
+    violations = lint_paths(args.paths, schema, jobs=args.jobs)
+    if args.format == "json":
+        json.dump([violation.to_dict() for violation in violations], sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        for violation in violations:
+            print(
+                f"{violation.path}:{violation.line}: "
+                f"[{violation.code}] {violation.message}"
+            )
+    return 1 if violations else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for the ``qatoolbox`` command.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``
+
+    Returns:
+        int: Process exit code
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == "lint":
+        return _run_lint(args)
+    return 2
@@ -0,0 +1,79 @@
+import configparser
+import os
+import tomllib
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+CONFIG_FILES = ("pytest.ini", ".pytest.ini", "pyproject.toml", "tox.ini", "setup.cfg")
+
+
+def read_ini_options(path: Path) -> Optional[dict[str, Any]]:
+    """Read pytest ini options from a single configuration file.
+
+    Args:
+        path: Path to a pytest.ini, pyproject.toml, tox.ini or setup.cfg file
+
+    Returns:
+        Optional[dict]: Raw ini options, or None if the file holds no pytest section
+    """
+    if path.suffix == ".toml":
+        with path.open("rb") as file:
+            data = tomllib.load(file)
+        return data.get("tool", {}).get("pytest", {}).get("ini_options")
+
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path, encoding="utf-8")
+    section = "tool:pytest" if path.name == "setup.cfg" else "pytest"
+    if not parser.has_section(section):
+        return None
+    return dict(parser.items(section))
+
+
+def find_ini_options(start: Path) -> dict[str, Any]:
+    """Locate the pytest configuration that applies to a directory.
+
+    Mirrors pytest's lookup: walk up from ``start`` and use the first file
+    that contains a pytest section.
+
+    Args:
+        start: Directory to start searching from
+
+    Returns:
+        dict: Raw ini options, empty if no configuration was found
+    """
+    for directory in (start.resolve(), *start.resolve().parents):
+        for name in CONFIG_FILES:
+            candidate = directory / name
+            if candidate.is_file():
+                options = read_ini_options(candidate)
+                if options is not None:
+                    return options
+    return {}
+
+
+def common_ancestor(paths: Iterable[Path]) -> Path:
+    """Return the directory pytest starts its configuration lookup from.
+
+    Like pytest, files count as their parent directory and the deepest
+    directory containing all of them is used.
+
+    Args:
+        paths: Existing files or directories
+
+    Returns:
+        Path: Absolute common ancestor directory
+    """
+    directories = [
+        path if path.is_dir() else path.parent
+        for path in (Path(path).resolve() for path in paths)
+    ]
+    return Path(os.path.commonpath(directories))
+
+
+def as_lines(value: Any) -> list[str]:
+    """Normalize a pytest ``linelist`` ini value to a list of strings."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.splitlines()
+    return [line.strip() for line in value if str(line).strip()]
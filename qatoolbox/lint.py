@@ -0,0 +1,203 @@
+"""Static validation of requirement metadata across a code base.
+
+Source files are parsed with ``ast`` rather than imported, so linting never
+executes test code and can be spread over worker processes.
+"""
+
+import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from qatoolbox.markers.labeling import RESERVED_PARAMETERS
+from qatoolbox.markers.schema import RequirementSchema
+
+SKIPPED_DIRECTORIES = frozenset(
+    {"__pycache__", "node_modules", "build", "dist", "venv", "site-packages"}
+)
+
+# Below this many files, process start-up costs more than it saves
+_PARALLEL_THRESHOLD = 32
+
+
+@dataclass(frozen=True)
+class RequirementUsage:
+    """A ``requirement(...)`` decorator found in a source file."""
+
+    path: str
+    line: int
+    testcase_id: Optional[str]
+    priority: Optional[str]
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Violation:
+    """A requirement that breaks the project schema."""
+
+    path: str
+    line: int
+    testcase_id: Optional[str]
+    code: str
+    message: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def iter_python_files(paths: Iterable[str]) -> Iterator[Path]:
+    """Yield Python files under the given files and directories.
+
+    Hidden directories and common build/virtualenv directories are skipped.
+    """
+    for raw_path in paths:
+        path = Path(raw_path)
+        if path.is_file():
+            if path.suffix == ".py":
+                yield path
+            continue
+        for root, directories, files in os.walk(path):
+            directories[:] = sorted(
+                name
+                for name in directories
+                if not name.startswith(".") and name not in SKIPPED_DIRECTORIES
+            )
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    yield Path(root) / name
+
+
+def _is_requirement_call(node: ast.expr) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id == "requirement"
+    return isinstance(func, ast.Attribute) and func.attr == "requirement"
+
+
+def _literal_string(node: Optional[ast.expr]) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def scan_file(path: str) -> tuple[list[RequirementUsage], list[Violation]]:
+    """Collect requirement decorators from a single source file.
+
+    Args:
+        path: Python source file to parse
+
+    Returns:
+        tuple: Requirement usages found, and violations that prevent analysis
+    """
+    try:
+        source = Path(path).read_bytes()
+        tree = ast.parse(source, filename=path)
+    except (OSError, SyntaxError, ValueError) as exc:
+        line = getattr(exc, "lineno", None) or 0
+        return [], [Violation(path, line, None, "parse-error", str(exc))]
+
+    usages: list[RequirementUsage] = []
+    violations: list[Violation] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if not _is_requirement_call(decorator):
+                continue
+            assert isinstance(decorator, ast.Call)
+            keywords = {kw.arg: kw.value for kw in decorator.keywords if kw.arg}
+            testcase_id = _literal_string(
+                decorator.args[0] if decorator.args else keywords.get("testcase_id")
+            )
+            if testcase_id is None:
+                violations.append(
+                    Violation(
+                        path,
+                        decorator.lineno,
+                        None,
+                        "dynamic-id",
+                        "Test case ID is not a string literal",
+                    )
+                )
+                continue
+            usages.append(
+                RequirementUsage(
+                    path=path,
+                    line=decorator.lineno,
+                    testcase_id=testcase_id,
+                    priority=_literal_string(keywords.get("priority")),
+                    fields=tuple(
+                        name for name in keywords if name not in RESERVED_PARAMETERS
+                    ),
+                )
+            )
+    return usages, violations
+
+
+def lint_paths(
+    paths: Iterable[str],
+    schema: RequirementSchema,
+    jobs: Optional[int] = None,
+) -> list[Violation]:
+    """Validate every requirement decorator found under the given paths.
+
+    Files are parsed in parallel; schema checks and duplicate detection run
+    once the results are gathered.
+
+    Args:
+        paths: Files or directories to scan
+        schema: Schema to validate the requirements against
+        jobs: Number of worker processes (default: CPU count)
+
+    Returns:
+        list[Violation]: Violations sorted by path and line
+    """
+    files = [str(path) for path in iter_python_files(paths)]
+    if jobs == 1 or len(files) < _PARALLEL_THRESHOLD:
+        results = list(map(scan_file, files))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(files) // ((jobs or os.cpu_count() or 1) * 4))
+            results = list(executor.map(scan_file, files, chunksize=chunksize))
+
+    violations: list[Violation] = []
+    first_seen: dict[str, RequirementUsage] = {}
+    for usages, file_violations in results:
+        violations.extend(file_violations)
+        for usage in usages:
+            assert usage.testcase_id is not None
+            if not usage.testcase_id.strip():
+                violations.append(
+                    Violation(
+                        usage.path,
+                        usage.line,
+                        usage.testcase_id,
+                        "empty-id",
+                        "Test case ID must be a non-empty string",
+                    )
+                )
+                continue
+            fields = dict.fromkeys(usage.fields)
+            for code, message in schema.check(
+                usage.testcase_id, usage.priority, fields
+            ):
+                violations.append(
+                    Violation(usage.path, usage.line, usage.testcase_id, code, message)
+                )
+            original = first_seen.setdefault(usage.testcase_id, usage)
+            if original is not usage:
+                violations.append(
+                    Violation(
+                        usage.path,
+                        usage.line,
+                        usage.testcase_id,
+                        "duplicate-id",
+                        f"Test case ID {usage.testcase_id!r} is already used at "
+                        f"{original.path}:{original.line}",
+                    )
+                )
+    return sorted(violations, key=lambda violation: (violation.path, violation.line))
@@ -7,9 +7,57 @@ import pytest
 
 from qatoolbox.internal.errors import ToolboxInvalidTestError
 from qatoolbox.internal.utils import is_running_in_ci
+from qatoolbox.markers.schema import get_schema
 
 TestFunction = TypeVar("TestFunction", bound=Callable[..., Any])
 
+_STANDARD_FIELDS = ("testcase_id", "description", "priority", "component")
+
+# Parameters of ``requirement`` that are not extra metadata fields
+RESERVED_PARAMETERS = (*_STANDARD_FIELDS, "inplace")
+
+_inplace_by_default = False
+
+
+def set_inplace_default(inplace: bool) -> bool:
+    """Choose whether ``requirement`` annotates tests in place by default.
+
+    Args:
+        inplace: True to annotate test functions instead of wrapping them
+
+    Returns:
+        bool: Previous default, for restoring later
+    """
+    global _inplace_by_default
+    previous, _inplace_by_default = _inplace_by_default, inplace
+    return previous
+
+
+def print_banner(metadata: dict[str, Any], func: Callable[..., Any]) -> None:
+    """Print the requirement metadata banner for a test function.
+
+    Args:
+        metadata: Requirement metadata including ``testcase_id``
+        func: Test function being executed
+    """
+    print(f"\n{'='*60}")
+    print(f"TEST CASE: {metadata['testcase_id']}")
+    print(f"{'='*60}")
+
+    if metadata.get("description"):
+        print(f"Description: {metadata['description']}")
+    if metadata.get("priority"):
+        print(f"Priority: {metadata['priority']}")
+    if metadata.get("component"):
+        print(f"Component: {metadata['component']}")
+    for name, value in metadata.items():
+        if name not in RESERVED_PARAMETERS:
+            print(f"{name.replace('_', ' ').capitalize()}: {value}")
+
+    print(f"Function: {func.__name__}")
+    print(f"Module: {func.__module__}")
+    print(f"{'='*60}\n")
+
 
 def requirement(
     testcase_id: str,
@@ -17,23 +65,54 @@ def requirement(
     description: Optional[str] = None,
     priority: Optional[str] = None,
     component: Optional[str] = None,
+    inplace: Optional[bool] = None,
+    **fields: Any,
 ) -> Callable:
     """Decorator to assign unique test case IDs with optional metadata.
 
     This decorator stores test case metadata and prints it during test execution.
-    It avoids pytest marker complexity by using a simple function wrapper approach.
+    The metadata is also attached as a ``pytest.mark.requirement`` marker, so it
+    can be selected with ``-m`` expressions such as
+    ``-m "requirement(priority='high')"``.
+
+    Metadata is validated once, at decoration time, against the active
+    project schema (see ``qatoolbox.markers.schema``).
+
+    In place mode leaves the test function unwrapped: the metadata and marker
+    are attached to the original function and the banner is printed by the
+    ``qatoolbox.plugin`` pytest hooks instead, so the test runs without an
+    extra call frame in its execution or tracebacks.
 
     Args:
         testcase_id: Unique identifier for the test case (e.g., "TC001", "USER_LOGIN_001")
         description: Optional human-readable description of the test
         priority: Optional priority level (e.g., "high", "medium", "low", "critical")
         component: Optional component/module being tested
+        inplace: Annotate the test function instead of wrapping it; defaults to
+            the ``requirement_inplace`` ini option
+        **fields: Additional metadata such as tags, owners, tickets or risk
 
     Returns:
         Decorator function that wraps the test function with metadata printing
     """
     if not isinstance(testcase_id, str) or not testcase_id.strip():
         raise ToolboxInvalidTestError("Test case ID must be a non-empty string")
+    get_schema().validate(testcase_id, priority, fields)
+
+    metadata = {
+        "testcase_id": testcase_id,
+        "description": description,
+        "priority": priority,
+        "component": component,
+        **fields,
+    }
+    marker = pytest.mark.requirement(
+        testcase_id,
+        **{key: value for key, value in metadata.items() if key != "testcase_id"},
+    )
+
+    if inplace is None:
+        inplace = _inplace_by_default
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         """Internal decorator function that wraps the test with metadata printing.
@@ -45,34 +124,37 @@ def requirement(
             TestFunction: Wrapped test function that prints metadata
         """
 
+        if inplace:
+            func._qatoolbox_metadata = dict(metadata)  # type: ignore
+            func._qatoolbox_inplace = True  # type: ignore
+            return marker(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            print(f"\n{'='*60}")
-            print(f"TEST CASE: {testcase_id}")
-            print(f"{'='*60}")
-
-            if description:
-                print(f"Description: {description}")
-            if priority:
-                print(f"Priority: {priority}")
-            if component:
-                print(f"Component: {component}")
-
-            print(f"Function: {func.__name__}")
-            print(f"Module: {func.__module__}")
-            print(f"{'='*60}\n")
+            print_banner(metadata, func)
 
             # Execute the original function
             return func(*args, **kwargs)
 
         # Store metadata as attributes for potential future use
-        wrapper._qatoolbox_metadata = {  # type: ignore
-            "testcase_id": testcase_id,
-            "description": description,
-            "priority": priority,
-            "component": component,
-        }
+        wrapper._qatoolbox_metadata = dict(metadata)  # type: ignore
 
-        return wrapper
+        return marker(wrapper)
 
     return decorator
+
+
+def requirement_metadata(item: pytest.Item) -> Optional[dict[str, Any]]:
+    """Return the requirement metadata attached to a collected test item.
+
+    Args:
+        item: Collected pytest item
+
+    Returns:
+        Optional[dict]: Metadata including ``testcase_id``, or None if the
+            test is not decorated with ``requirement``
+    """
+    marker = item.get_closest_marker("requirement")
+    if marker is None or not marker.args:
+        return None
+    return {"testcase_id": marker.args[0], **marker.kwargs}
@@ -0,0 +1,155 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from qatoolbox.internal.config import as_lines
+from qatoolbox.internal.errors import ToolboxInvalidTestError
+
+
+@dataclass(frozen=True)
+class RequirementSchema:
+    """Project-level rules that requirement metadata must satisfy.
+
+    The schema is compiled once (usually at pytest configuration time) and
+    checked when a test is decorated, so running a test never pays for it.
+
+    Attributes:
+        id_pattern: Compiled pattern that every test case ID must fully match
+        priorities: Allowed priority values, or None to accept any priority
+        fields: Allowed extra metadata field names, or None to accept any field
+    """
+
+    id_pattern: Optional[re.Pattern[str]] = None
+    priorities: Optional[frozenset[str]] = None
+    fields: Optional[frozenset[str]] = None
+
+    @classmethod
+    def compile(
+        cls,
+        id_pattern: Optional[str] = None,
+        priorities: Iterable[str] = (),
+        fields: Iterable[str] = (),
+    ) -> "RequirementSchema":
+        """Build a schema from raw configuration values.
+
+        Args:
+            id_pattern: Regular expression for test case IDs, empty to disable
+            priorities: Allowed priority values, empty to accept any priority
+            fields: Allowed extra field names, empty to accept any field
+
+        Returns:
+            RequirementSchema: Compiled schema
+
+        Raises:
+            ToolboxInvalidTestError: If the ID pattern is not a valid regex
+        """
+        try:
+            pattern = re.compile(id_pattern) if id_pattern else None
+        except re.error as exc:
+            raise ToolboxInvalidTestError(
+                f"Invalid requirement ID pattern {id_pattern!r}: {exc}"
+            ) from exc
+        return cls(
+            id_pattern=pattern,
+            priorities=frozenset(priorities) or None,
+            fields=frozenset(fields) or None,
+        )
+
+    @classmethod
+    def from_ini_options(cls, options: Mapping[str, Any]) -> "RequirementSchema":
+        """Build a schema from raw pytest ini options read outside of pytest.
+
+        Args:
+            options: Options as returned by ``qatoolbox.internal.config``
+
+        Returns:
+            RequirementSchema: Compiled schema
+        """
+        return cls.compile(
+            str(options.get("requirement_id_pattern") or "").strip(),
+            as_lines(options.get("requirement_priorities")),
+            as_lines(options.get("requirement_fields")),
+        )
+
+    def check(
+        self,
+        testcase_id: str,
+        priority: Optional[str] = None,
+        fields: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[tuple[str, str]]:
+        """Yield every schema violation for the given requirement metadata.
+
+        Args:
+            testcase_id: Test case ID to validate
+            priority: Priority value, ignored when None
+            fields: Extra metadata fields passed to the requirement
+
+        Yields:
+            tuple[str, str]: Violation code and human-readable message
+        """
+        if self.id_pattern is not None and not self.id_pattern.fullmatch(testcase_id):
+            yield (
+                "invalid-id",
+                f"Test case ID {testcase_id!r} does not match "
+                f"pattern {self.id_pattern.pattern!r}",
+            )
+        if (
+            self.priorities is not None
+            and priority is not None
+            and priority not in self.priorities
+        ):
+            allowed = ", ".join(sorted(self.priorities))
+            yield (
+                "invalid-priority",
+                f"Invalid priority {priority!r} for {testcase_id}, "
+                f"expected one of: {allowed}",
+            )
+        if self.fields is not None and fields:
+            unknown = sorted(set(fields) - self.fields)
+            if unknown:
+                yield (
+                    "unknown-field",
+                    f"Unknown requirement field(s) for {testcase_id}: "
+                    f"{', '.join(unknown)}",
+                )
+
+    def validate(
+        self,
+        testcase_id: str,
+        priority: Optional[str] = None,
+        fields: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Check requirement metadata against the schema.
+
+        Args:
+            testcase_id: Test case ID to validate
+            priority: Priority value, ignored when None
+            fields: Extra metadata fields passed to the requirement
+
+        Raises:
+            ToolboxInvalidTestError: On the first value that violates the schema
+        """
+        for _, message in self.check(testcase_id, priority, fields):
+            raise ToolboxInvalidTestError(message)
+
+
+_active_schema = RequirementSchema()
+
+
+def get_schema() -> RequirementSchema:
+    """Return the schema currently applied by the requirement decorator."""
+    return _active_schema
+
+
+def set_schema(schema: RequirementSchema) -> RequirementSchema:
+    """Install a schema for subsequent requirement decorations.
+
+    Args:
+        schema: Schema to apply
+
+    Returns:
+        RequirementSchema: Previously active schema, for restoring later
+    """
+    global _active_schema
+    previous, _active_schema = _active_schema, schema
+    return previous
@@ -0,0 +1,307 @@
+"""Pytest plugin for qatoolbox.
+
+Registered through the ``pytest11`` entry point, so pytest loads it
+automatically once qa-toolbox is installed.
+"""
+
+from pathlib import Path
+from typing import Any, Generator, Optional
+
+import pytest
+
+from qatoolbox.internal.errors import ToolboxInvalidTestError
+from qatoolbox.markers.labeling import (
+    print_banner,
+    requirement_metadata,
+    set_inplace_default,
+)
+from qatoolbox.markers.schema import RequirementSchema, set_schema
+from qatoolbox.reporting.progress import ProgressReporter, ProgressServer
+from qatoolbox.reporting.resources import ResourceMonitor, ResourceProbe
+from qatoolbox.reporting.summary import RequirementSummary
+from qatoolbox.reporting.tracing import TRACE_FORMATS, RequirementTracer
+from qatoolbox.selection.history import HistoryRecorder, load_history
+from qatoolbox.selection.rerun import FailedRequirementsSelector
+from qatoolbox.selection.smoke import (
+    SmokeSelector,
+    parse_priority_weights,
+    read_selection,
+    select_smoke_subset,
+    write_selection,
+)
+
+_previous_schema_key = pytest.StashKey[RequirementSchema]()
+_previous_inplace_key = pytest.StashKey[bool]()
+_plugins_key = pytest.StashKey[list[object]]()
+_report_metadata_key = pytest.StashKey[Optional[dict[str, Any]]]()
+
+
+def _register(config: pytest.Config, plugin: object, name: str) -> None:
+    """Register a qatoolbox sub-plugin for the lifetime of the config."""
+    config.stash.setdefault(_plugins_key, []).append(plugin)
+    config.pluginmanager.register(plugin, name)
+
+
+def _worker_path(config: pytest.Config, path: str) -> Path:
+    """Give each pytest-xdist worker its own output file."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return Path(path)
+    result = Path(path)
+    return result.with_name(f"{result.stem}.{workerinput['workerid']}{result.suffix}")
+
+
+def _runs_tests(config: pytest.Config) -> bool:
+    """Whether tests run in this process rather than on pytest-xdist workers."""
+    if hasattr(config, "workerinput"):
+        return True
+    return getattr(config.option, "dist", "no") == "no"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("qatoolbox", "qatoolbox requirement reporting")
+    group.addoption(
+        "--requirement-trace",
+        metavar="PATH",
+        default=None,
+        help="Write tracing spans for requirement tests to PATH",
+    )
+    group.addoption(
+        "--requirement-trace-format",
+        choices=TRACE_FORMATS,
+        default="chrome",
+        help="Trace file format: Chrome trace events (viewable in Perfetto) "
+        "or OTLP-JSON lines (default: chrome)",
+    )
+    group.addoption(
+        "--requirement-resources",
+        action="store_true",
+        default=False,
+        help="Sample RSS, CPU time and open file descriptors around each "
+        "requirement test and report the largest growth",
+    )
+    group.addoption(
+        "--requirement-resources-json",
+        metavar="PATH",
+        default=None,
+        help="Also write the requirement resource report as JSON to PATH "
+        "(implies --requirement-resources)",
+    )
+    group.addoption(
+        "--requirement-progress",
+        metavar="ADDRESS",
+        default=None,
+        help="Stream requirement progress as Server-Sent Events on ADDRESS, "
+        "either HOST:PORT (port 0 picks a free port) or unix:PATH",
+    )
+    group.addoption(
+        "--requirement-summary",
+        action="store_true",
+        default=False,
+        help="Show requirement outcomes grouped by component and priority",
+    )
+    group.addoption(
+        "--requirement-summary-json",
+        metavar="PATH",
+        default=None,
+        help="Also write the requirement summary as JSON to PATH "
+        "(implies --requirement-summary)",
+    )
+    group.addoption(
+        "--rerun-failed-requirements",
+        action="store_true",
+        default=False,
+        help="Only run the requirements whose latest run failed, matched by "
+        "test case ID so moved or renamed tests are still found",
+    )
+    group.addoption(
+        "--requirement-smoke",
+        metavar="PATH",
+        default=None,
+        help="Only run the requirements listed in the smoke selection file PATH",
+    )
+    group.addoption(
+        "--requirement-smoke-generate",
+        metavar="PATH",
+        default=None,
+        help="Write a smoke selection file to PATH from the recorded "
+        "requirement history and exit",
+    )
+    group.addoption(
+        "--requirement-smoke-budget",
+        metavar="SECONDS",
+        type=float,
+        default=120.0,
+        help="Runtime budget for --requirement-smoke-generate (default: 120)",
+    )
+    parser.addini(
+        "requirement_id_pattern",
+        help="Regular expression that every requirement test case ID must match",
+        default="",
+    )
+    parser.addini(
+        "requirement_priorities",
+        type="linelist",
+        help="Allowed values for the requirement priority (default: any)",
+        default=[],
+    )
+    parser.addini(
+        "requirement_fields",
+        type="linelist",
+        help="Allowed extra requirement metadata fields (default: any)",
+        default=[],
+    )
+    parser.addini(
+        "requirement_inplace",
+        type="bool",
+        help="Attach requirement metadata to test functions in place instead "
+        "of wrapping them (default: false)",
+        default=False,
+    )
+    parser.addini(
+        "requirement_priority_weights",
+        type="linelist",
+        help="Smoke selection weight per priority as priority=weight lines "
+        "(default: critical=8, high=4, medium=2, low=1)",
+        default=[],
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "requirement(testcase_id, **metadata): test case ID and metadata "
+        "attached by qatoolbox.markers.labeling.requirement",
+    )
+    try:
+        schema = RequirementSchema.compile(
+            config.getini("requirement_id_pattern"),
+            config.getini("requirement_priorities"),
+            config.getini("requirement_fields"),
+        )
+    except ToolboxInvalidTestError as exc:
+        raise pytest.UsageError(str(exc)) from exc
+    config.stash[_previous_schema_key] = set_schema(schema)
+    config.stash[_previous_inplace_key] = set_inplace_default(
+        config.getini("requirement_inplace")
+    )
+
+    trace_path = config.getoption("requirement_trace")
+    if trace_path and _runs_tests(config):
+        tracer = RequirementTracer(
+            _worker_path(config, trace_path),
+            config.getoption("requirement_trace_format"),
+        )
+        _register(config, tracer, "qatoolbox-tracer")
+
+    resources_json = config.getoption("requirement_resources_json")
+    if config.getoption("requirement_resources") or resources_json:
+        if _runs_tests(config):
+            _register(config, ResourceProbe(), "qatoolbox-resources-probe")
+        if not hasattr(config, "workerinput"):
+            monitor = ResourceMonitor(Path(resources_json) if resources_json else None)
+            _register(config, monitor, "qatoolbox-resources")
+
+    progress_address = config.getoption("requirement_progress")
+    if progress_address and not hasattr(config, "workerinput"):
+        server = ProgressServer(progress_address)
+        try:
+            server.start()
+        except (OSError, ValueError) as exc:
+            raise pytest.UsageError(
+                f"Cannot serve requirement progress on {progress_address}: {exc}"
+            ) from exc
+        _register(config, ProgressReporter(server), "qatoolbox-progress")
+
+    summary_json = config.getoption("requirement_summary_json")
+    if (config.getoption("requirement_summary") or summary_json) and not hasattr(
+        config, "workerinput"
+    ):
+        summary = RequirementSummary(Path(summary_json) if summary_json else None)
+        _register(config, summary, "qatoolbox-summary")
+
+    smoke_path = config.getoption("requirement_smoke")
+    if smoke_path:
+        try:
+            selector = SmokeSelector(read_selection(Path(smoke_path)))
+        except (OSError, ValueError) as exc:
+            raise pytest.UsageError(
+                f"Cannot use smoke selection {smoke_path}: {exc}"
+            ) from exc
+        _register(config, selector, "qatoolbox-smoke")
+
+
+def _generate_smoke_subset(config: pytest.Config, cache: pytest.Cache) -> str:
+    """Write the smoke selection file and return a one-line summary."""
+    try:
+        weights = parse_priority_weights(config.getini("requirement_priority_weights"))
+    except ValueError as exc:
+        raise pytest.UsageError(f"requirement_priority_weights: {exc}") from exc
+    history = load_history(cache)
+    if not history:
+        raise pytest.UsageError(
+            "No requirement history recorded yet; run the test suite before "
+            "generating a smoke subset"
+        )
+    budget = config.getoption("requirement_smoke_budget")
+    selected = select_smoke_subset(history, budget, weights)
+    if not selected:
+        raise pytest.UsageError(f"No requirement fits in a {budget:g}s smoke budget")
+    path = Path(config.getoption("requirement_smoke_generate"))
+    write_selection(path, selected, history)
+    return (
+        f"Selected {len(selected)} of {len(history)} requirements for a "
+        f"{budget:g}s budget: {path}"
+    )
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    config = session.config
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        for option in ("--requirement-smoke-generate", "--rerun-failed-requirements"):
+            if config.getoption(option):
+                raise pytest.UsageError(f"{option} needs the cacheprovider plugin")
+        return
+    if config.getoption("requirement_smoke_generate"):
+        pytest.exit(_generate_smoke_subset(config, cache), returncode=0)
+    if config.getoption("rerun_failed_requirements"):
+        _register(config, FailedRequirementsSelector(cache), "qatoolbox-rerun")
+    if not hasattr(config, "workerinput"):
+        _register(config, HistoryRecorder(cache), "qatoolbox-history")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    for plugin in config.stash.get(_plugins_key, []):
+        config.pluginmanager.unregister(plugin)
+    config.stash[_plugins_key] = []
+    previous = config.stash.get(_previous_schema_key, None)
+    if previous is not None:
+        set_schema(previous)
+    if _previous_inplace_key in config.stash:
+        set_inplace_default(config.stash[_previous_inplace_key])
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item: pytest.Item) -> None:
+    # Tests annotated in place have no wrapper to print their banner
+    func = getattr(item, "obj", None)
+    if getattr(func, "_qatoolbox_inplace", False):
+        print_banner(func._qatoolbox_metadata, func)  # type: ignore[union-attr]
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item,
+) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    report = yield
+    if _report_metadata_key not in item.stash:
+        metadata = requirement_metadata(item)
+        item.stash[_report_metadata_key] = metadata and {
+            key: metadata.get(key) for key in ("testcase_id", "priority", "component")
+        }
+    # Plain attributes are serialized with the report, so they also reach the
+    # pytest-xdist controller
+    report.qatoolbox_requirement = item.stash[_report_metadata_key]  # type: ignore
+    return report
@@ -0,0 +1,74 @@
+from typing import Any, Optional
+
+import pytest
+
+# Most severe first, used to combine the outcomes of a test's phases
+OUTCOME_SEVERITY = ("error", "failed", "xpassed", "xfailed", "skipped", "passed")
+
+
+def report_requirement(report: pytest.TestReport) -> Optional[dict[str, Any]]:
+    """Return the requirement metadata the plugin attached to a report.
+
+    Returns:
+        Optional[dict]: ``testcase_id``, ``priority`` and ``component``, or
+            None if the test has no requirement
+    """
+    return getattr(report, "qatoolbox_requirement", None)
+
+
+def report_outcome(report: pytest.TestReport) -> Optional[str]:
+    """Return the test outcome decided by a single phase report.
+
+    Args:
+        report: Setup, call or teardown report of a test
+
+    Returns:
+        Optional[str]: One of ``OUTCOME_SEVERITY``, or None if the report does
+            not affect the outcome (e.g. a passing setup or teardown)
+    """
+    xfail = hasattr(report, "wasxfail")
+    if report.when == "call":
+        if xfail:
+            return "xfailed" if report.skipped else "xpassed"
+        return report.outcome
+    if report.failed:
+        return "error"
+    if report.skipped:
+        return "xfailed" if xfail else "skipped"
+    return None
+
+
+def worst_outcome(first: Optional[str], second: Optional[str]) -> Optional[str]:
+    """Combine two phase outcomes, keeping the most severe one."""
+    if first is None or second is None:
+        return first or second
+    return min(first, second, key=OUTCOME_SEVERITY.index)
+
+
+class OutcomeTracker:
+    """Combine the phase reports of each test into one final outcome.
+
+    Reports of different tests may interleave with pytest-xdist, so the
+    outcome so far is kept per node ID until the teardown report arrives.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, Optional[str]] = {}
+
+    def update(self, report: pytest.TestReport) -> Optional[str]:
+        """Record a phase report.
+
+        Args:
+            report: Setup, call or teardown report of a test
+
+        Returns:
+            Optional[str]: Final outcome of the test once its teardown is
+                reported, None for earlier phases
+        """
+        outcome = worst_outcome(
+            self._pending.pop(report.nodeid, None), report_outcome(report)
+        )
+        if report.when != "teardown":
+            self._pending[report.nodeid] = outcome
+            return None
+        return outcome or "passed"
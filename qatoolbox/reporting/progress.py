@@ -0,0 +1,236 @@
+"""Live progress streaming for long requirement runs.
+
+An asyncio server running in a background thread publishes requirement
+start/finish events as Server-Sent Events, plus a JSON snapshot of the
+running counts by component and priority. The test thread only hands events
+over to the server's event loop, so reporting never blocks test execution.
+
+Endpoints:
+    ``GET /events``: ``text/event-stream`` of ``start`` and ``finish`` events,
+        preceded by a ``status`` snapshot
+    ``GET /status``: JSON snapshot of the running counts
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Optional
+
+import pytest
+
+from qatoolbox.reporting.outcomes import OutcomeTracker, report_requirement
+
+# Events queued per client before further events are dropped for that client
+CLIENT_QUEUE_SIZE = 1024
+
+
+class ProgressServer:
+    """HTTP/SSE server publishing requirement progress from a daemon thread.
+
+    Args:
+        address: ``HOST:PORT`` (port 0 picks a free port) or ``unix:PATH``
+    """
+
+    def __init__(self, address: str) -> None:
+        self.requested_address = address
+        self.address = ""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._clients: set[asyncio.Queue[Optional[dict[str, Any]]]] = set()
+        self._started = 0
+        self._finished = 0
+        self._outcomes: Counter[str] = Counter()
+        self._components: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._priorities: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def start(self) -> str:
+        """Start serving and return the bound address."""
+        self._thread = threading.Thread(
+            target=self._run, name="qatoolbox-progress", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self.address
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Hand an event to the server thread without waiting for delivery."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._dispatch, event)
+
+    def stop(self) -> None:
+        """Close client streams, stop the server and join its thread."""
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the running counts. Must be called on the server thread."""
+        return {
+            "started": self._started,
+            "finished": self._finished,
+            "running": self._started - self._finished,
+            "outcomes": dict(self._outcomes),
+            "components": {key: dict(value) for key, value in self._components.items()},
+            "priorities": {key: dict(value) for key, value in self._priorities.items()},
+        }
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            self._server = loop.run_until_complete(self._listen())
+        except BaseException as exc:  # pylint: disable=broad-except
+            self._error = exc
+            self._ready.set()
+            loop.close()
+            return
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def _listen(self) -> asyncio.AbstractServer:
+        if self.requested_address.startswith("unix:"):
+            path = self.requested_address[len("unix:") :]
+            server = await asyncio.start_unix_server(self._handle, path=path)
+            self.address = f"unix:{path}"
+            return server
+        host, _, port = self.requested_address.rpartition(":")
+        server = await asyncio.start_server(
+            self._handle, host=host or "127.0.0.1", port=int(port)
+        )
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        self.address = f"http://{bound_host}:{bound_port}"
+        return server
+
+    def _dispatch(self, event: dict[str, Any]) -> None:
+        if event["type"] == "start":
+            self._started += 1
+        elif event["type"] == "finish":
+            self._finished += 1
+            outcome = event["outcome"]
+            self._outcomes[outcome] += 1
+            self._components[event.get("component") or "unknown"][outcome] += 1
+            self._priorities[event.get("priority") or "unknown"][outcome] += 1
+        for queue in self._clients:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+
+    def _shutdown(self) -> None:
+        for queue in self._clients:
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+        assert self._server is not None and self._loop is not None
+        self._server.close()
+        self._loop.call_later(0.1, self._loop.stop)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            method, path, *_ = request.decode("latin-1").split(" ", 2)
+            if method != "GET":
+                await self._respond(writer, "405 Method Not Allowed", {})
+            elif path == "/status":
+                await self._respond(writer, "200 OK", self.snapshot())
+            elif path == "/events":
+                await self._stream(writer)
+            else:
+                await self._respond(writer, "404 Not Found", {})
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, status: str, body: dict[str, Any]
+    ) -> None:
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+
+    async def _stream(self, writer: asyncio.StreamWriter) -> None:
+        queue: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue(
+            CLIENT_QUEUE_SIZE
+        )
+        self._clients.add(queue)
+        try:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\n"
+                b"Connection: keep-alive\r\n\r\n"
+            )
+            writer.write(_sse("status", self.snapshot()))
+            await writer.drain()
+            while (event := await queue.get()) is not None:
+                writer.write(_sse(event["type"], event))
+                await writer.drain()
+        finally:
+            self._clients.discard(queue)
+
+
+def _sse(name: str, data: dict[str, Any]) -> bytes:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class ProgressReporter:
+    """Pytest plugin feeding requirement progress to a ``ProgressServer``.
+
+    Events are derived from test reports, which pytest-xdist forwards to the
+    controller, so progress is published from a single place in both serial
+    and distributed runs.
+    """
+
+    def __init__(self, server: ProgressServer) -> None:
+        self.server = server
+        self._outcomes = OutcomeTracker()
+
+    def pytest_report_header(self) -> str:
+        return f"requirement progress: {self.server.address}"
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        requirement = report_requirement(report)
+        if requirement is None:
+            return
+        if report.when == "setup":
+            self.server.publish(
+                {"type": "start", "nodeid": report.nodeid, "time": time.time()}
+                | requirement
+            )
+        outcome = self._outcomes.update(report)
+        if outcome is None:
+            return
+        self.server.publish(
+            {
+                "type": "finish",
+                "nodeid": report.nodeid,
+                "time": time.time(),
+                "outcome": outcome,
+            }
+            | requirement
+        )
+
+    def pytest_unconfigure(self) -> None:
+        self.server.stop()
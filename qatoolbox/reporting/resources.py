@@ -0,0 +1,201 @@
+"""Resource usage sampling for requirement tests.
+
+Snapshots of RSS, CPU time and open file descriptors are taken before and
+after each test decorated with ``requirement``; the deltas are attributed to
+its test case ID to surface tests that leak memory or file descriptors.
+"""
+
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Generator, NamedTuple, Optional
+
+import pytest
+
+from qatoolbox.markers.labeling import requirement_metadata
+from qatoolbox.reporting.outcomes import report_requirement
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+class ResourceSample(NamedTuple):
+    """Process resource usage at a point in time."""
+
+    rss: int
+    cpu_time: float
+    open_fds: int
+
+
+_before_key = pytest.StashKey[ResourceSample]()
+
+
+class ResourceSampler:
+    """Take cheap snapshots of the current process resource usage.
+
+    On Linux the current RSS is read from a file descriptor on
+    ``/proc/self/statm`` that stays open for the sampler's lifetime, so a
+    sample costs a few system calls and no allocations beyond the result.
+    Elsewhere the peak RSS reported by ``getrusage`` is used instead.
+    """
+
+    def __init__(self) -> None:
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 1
+        try:
+            self._statm_fd: Optional[int] = os.open("/proc/self/statm", os.O_RDONLY)
+        except OSError:
+            self._statm_fd = None
+        self._fd_dir = next(
+            (path for path in ("/proc/self/fd", "/dev/fd") if os.path.isdir(path)),
+            None,
+        )
+        # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+        self._maxrss_scale = 1 if sys.platform == "darwin" else 1024
+
+    def sample(self) -> ResourceSample:
+        """Return the current resource usage of this process."""
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            cpu_time = usage.ru_utime + usage.ru_stime
+            max_rss = usage.ru_maxrss
+        else:  # pragma: no cover - Windows
+            cpu_time = time.process_time()
+            max_rss = 0
+        if self._statm_fd is not None:
+            rss = int(os.pread(self._statm_fd, 64, 0).split()[1]) * self._page_size
+        else:
+            rss = max_rss * self._maxrss_scale
+        open_fds = len(os.listdir(self._fd_dir)) if self._fd_dir else 0
+        return ResourceSample(rss, cpu_time, open_fds)
+
+    def close(self) -> None:
+        if self._statm_fd is not None:
+            os.close(self._statm_fd)
+            self._statm_fd = None
+
+
+@dataclass
+class ResourceUsage:
+    """Accumulated resource deltas for one test case ID."""
+
+    testcase_id: str
+    runs: int = 0
+    rss_delta: int = 0
+    cpu_time: float = 0.0
+    fd_delta: int = 0
+
+    def add(self, before: ResourceSample, after: ResourceSample) -> None:
+        self.runs += 1
+        self.rss_delta += after.rss - before.rss
+        self.cpu_time += after.cpu_time - before.cpu_time
+        self.fd_delta += after.open_fds - before.open_fds
+
+
+class ResourceProbe:
+    """Pytest plugin sampling resource usage around requirement tests.
+
+    Sampling covers the whole test protocol (setup, call and teardown) so
+    resources leaked by fixtures are attributed to the test that requested
+    them. The samples are attached to the teardown report, which pytest-xdist
+    forwards to the controller. Tests without requirement metadata are not
+    sampled.
+    """
+
+    def __init__(self) -> None:
+        self._sampler = ResourceSampler()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(
+        self, item: pytest.Item
+    ) -> Generator[None, object, object]:
+        if requirement_metadata(item) is not None:
+            item.stash[_before_key] = self._sampler.sample()
+        return (yield)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(
+        self, item: pytest.Item, call: pytest.CallInfo[None]
+    ) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+        report = yield
+        if call.when == "teardown" and _before_key in item.stash:
+            # Plain tuples, so that pytest-xdist can serialize the report
+            samples = (tuple(item.stash[_before_key]), tuple(self._sampler.sample()))
+            report.qatoolbox_resources = samples  # type: ignore[attr-defined]
+        return report
+
+    def pytest_sessionfinish(self) -> None:
+        self._sampler.close()
+
+
+class ResourceMonitor:
+    """Pytest plugin accumulating the samples taken by ``ResourceProbe``.
+
+    Deltas are read from test reports, so with pytest-xdist the controller
+    aggregates the samples of every worker.
+    """
+
+    def __init__(self, json_path: Optional[Path] = None, top: int = 10) -> None:
+        self.json_path = json_path
+        self.top = top
+        self.usage: dict[str, ResourceUsage] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        samples = getattr(report, "qatoolbox_resources", None)
+        requirement = report_requirement(report)
+        if samples is None or requirement is None:
+            return
+        testcase_id = requirement["testcase_id"]
+        usage = self.usage.get(testcase_id)
+        if usage is None:
+            usage = self.usage[testcase_id] = ResourceUsage(testcase_id)
+        before, after = samples
+        usage.add(ResourceSample(*before), ResourceSample(*after))
+
+    def leak_report(self, key: str = "rss_delta") -> list[ResourceUsage]:
+        """Return requirements ranked by the growth of one resource.
+
+        Args:
+            key: ``rss_delta`` or ``fd_delta``
+
+        Returns:
+            list[ResourceUsage]: Usage of every requirement, largest growth first
+        """
+        return sorted(self.usage.values(), key=attrgetter(key), reverse=True)
+
+    def pytest_sessionfinish(self) -> None:
+        if self.json_path is not None:
+            self.json_path.parent.mkdir(parents=True, exist_ok=True)
+            report = [asdict(usage) for usage in self.leak_report()]
+            self.json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        terminalreporter.write_sep("=", "requirement resource growth")
+        # Ranked separately, so that memory noise cannot push a descriptor
+        # leak out of the top entries
+        rankings = [
+            (label, [usage for usage in self.leak_report(key) if getattr(usage, key)])
+            for label, key in (("RSS", "rss_delta"), ("File descriptors", "fd_delta"))
+        ]
+        rankings = [(label, ranked) for label, ranked in rankings if ranked]
+        if not rankings:
+            terminalreporter.write_line("No resource growth detected")
+        for label, ranked in rankings:
+            terminalreporter.write_line(f"{label}:")
+            terminalreporter.write_line(
+                f"{'Test case':<30} {'Runs':>5} {'RSS (KiB)':>12} "
+                f"{'FDs':>6} {'CPU (s)':>9}"
+            )
+            for usage in ranked[: self.top]:
+                terminalreporter.write_line(
+                    f"{usage.testcase_id:<30} {usage.runs:>5} "
+                    f"{usage.rss_delta / 1024:>+12.0f} {usage.fd_delta:>+6} "
+                    f"{usage.cpu_time:>9.3f}"
+                )
+        if self.json_path is not None:
+            terminalreporter.write_line(f"Full report: {self.json_path}")
@@ -0,0 +1,118 @@
+"""End of session summary of requirement outcomes by component and priority."""
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from qatoolbox.reporting.outcomes import (
+    OUTCOME_SEVERITY,
+    OutcomeTracker,
+    report_requirement,
+)
+
+# Placeholder for requirements without a component or priority
+UNSET = "-"
+
+
+def pass_rate(outcomes: Counter[str]) -> Optional[float]:
+    """Fraction of executed tests that passed, ignoring skips and xfails.
+
+    Returns:
+        Optional[float]: Pass rate between 0 and 1, or None if nothing ran
+    """
+    executed = sum(outcomes.values()) - outcomes["skipped"] - outcomes["xfailed"]
+    return outcomes["passed"] / executed if executed else None
+
+
+class RequirementSummary:
+    """Pytest plugin counting requirement outcomes as reports arrive.
+
+    Each test contributes one outcome, the most severe of its phases, to the
+    group of its component and priority. Counters are updated in
+    ``pytest_runtest_logreport`` so the summary never rescans past reports;
+    with pytest-xdist the controller receives every worker's reports and the
+    counts cover the whole run.
+    """
+
+    def __init__(self, json_path: Optional[Path] = None) -> None:
+        self.json_path = json_path
+        self.groups: dict[tuple[str, str], Counter[str]] = {}
+        self._outcomes = OutcomeTracker()
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        requirement = report_requirement(report)
+        if requirement is None:
+            return
+        outcome = self._outcomes.update(report)
+        if outcome is None:
+            return
+        key = (
+            requirement.get("component") or UNSET,
+            requirement.get("priority") or UNSET,
+        )
+        counts = self.groups.get(key)
+        if counts is None:
+            counts = self.groups[key] = Counter()
+        counts[outcome] += 1
+
+    def totals(self) -> Counter[str]:
+        """Return the outcome counts over all groups."""
+        total: Counter[str] = Counter()
+        for counts in self.groups.values():
+            total.update(counts)
+        return total
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as JSON-serializable data."""
+        groups = [
+            {
+                "component": component,
+                "priority": priority,
+                "total": sum(counts.values()),
+                "outcomes": dict(counts),
+                "pass_rate": pass_rate(counts),
+            }
+            for (component, priority), counts in sorted(self.groups.items())
+        ]
+        totals = self.totals()
+        return {
+            "groups": groups,
+            "totals": {
+                "total": sum(totals.values()),
+                "outcomes": dict(totals),
+                "pass_rate": pass_rate(totals),
+            },
+        }
+
+    def pytest_sessionfinish(self) -> None:
+        if self.json_path is not None:
+            self.json_path.parent.mkdir(parents=True, exist_ok=True)
+            self.json_path.write_text(
+                json.dumps(self.to_dict(), indent=2), encoding="utf-8"
+            )
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        terminalreporter.write_sep("=", "requirement summary")
+        if not self.groups:
+            terminalreporter.write_line("No requirement tests were run")
+            return
+        columns = list(reversed(OUTCOME_SEVERITY))
+        terminalreporter.write_line(
+            f"{'Component':<20} {'Priority':<10} {'Total':>6} "
+            + " ".join(f"{name.capitalize():>8}" for name in columns)
+            + f" {'Pass rate':>10}"
+        )
+        rows = sorted(self.groups.items())
+        rows.append((("TOTAL", ""), self.totals()))
+        for (component, priority), counts in rows:
+            rate = pass_rate(counts)
+            terminalreporter.write_line(
+                f"{component:<20} {priority:<10} {sum(counts.values()):>6} "
+                + " ".join(f"{counts[name]:>8}" for name in columns)
+                + f" {'n/a' if rate is None else f'{rate:.1%}':>10}"
+            )
+        if self.json_path is not None:
+            terminalreporter.write_line(f"JSON summary: {self.json_path}")
@@ -0,0 +1,269 @@
+"""Tracing spans for requirement tests.
+
+Each test decorated with ``requirement`` produces a span, with child spans for
+the setup, call and teardown phases and for every fixture set up along the
+way. Finished spans are buffered and written in batches, either as a Chrome
+trace-event file (viewable in Perfetto or ``chrome://tracing``) or as
+OTLP-JSON lines compatible with the OpenTelemetry file exporter.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Generator, Optional, Union
+
+import pytest
+
+from qatoolbox.markers.labeling import requirement_metadata
+from qatoolbox.reporting.outcomes import report_outcome, worst_outcome
+
+TRACE_FORMATS = ("chrome", "otlp")
+
+
+@dataclass
+class Span:
+    """A timed operation within a test run."""
+
+    name: str
+    category: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: bool = False
+
+
+class ChromeTraceWriter:
+    """Write spans as complete ("X") events of the Chrome trace-event format."""
+
+    def __init__(self, file: IO[str], pid: int) -> None:
+        self._file = file
+        self._pid = pid
+        self._tid = threading.get_ident()
+        self._separator = "[\n"
+
+    def write(self, spans: list[Span]) -> None:
+        for span in spans:
+            event = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": self._pid,
+                "tid": self._tid,
+                "args": span.attributes,
+            }
+            self._file.write(self._separator + json.dumps(event))
+            self._separator = ",\n"
+
+    def close(self) -> None:
+        self._file.write("[\n]\n" if self._separator == "[\n" else "\n]\n")
+
+
+class OtlpJsonWriter:
+    """Write each batch of spans as one OTLP ``ExportTraceServiceRequest`` line."""
+
+    def __init__(self, file: IO[str], trace_id: str, service_name: str) -> None:
+        self._file = file
+        self._trace_id = trace_id
+        self._resource = {"attributes": [_otlp_attribute("service.name", service_name)]}
+
+    def write(self, spans: list[Span]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "qatoolbox"},
+                            "spans": [self._span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        self._file.write(json.dumps(request) + "\n")
+
+    def close(self) -> None:
+        pass
+
+    def _span(self, span: Span) -> dict[str, Any]:
+        encoded = {
+            "traceId": self._trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [
+                _otlp_attribute(key, value) for key, value in span.attributes.items()
+            ],
+            "status": {"code": 2 if span.error else 1},
+        }
+        if span.parent_id is not None:
+            encoded["parentSpanId"] = span.parent_id
+        return encoded
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class RequirementTracer:
+    """Pytest plugin recording spans for requirement tests.
+
+    The tracer is only registered when tracing is requested, so runs without
+    it pay nothing. Tests without requirement metadata are not traced.
+    """
+
+    batch_size = 256
+
+    def __init__(self, path: Path, trace_format: str = "chrome") -> None:
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {trace_format}")
+        self.path = path
+        self.trace_format = trace_format
+        self.trace_id = os.urandom(16).hex()
+        self._buffer: list[Span] = []
+        self._stack: list[Span] = []
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[Union[ChromeTraceWriter, OtlpJsonWriter]] = None
+
+    def _start(self, name: str, category: str, **attributes: Any) -> Span:
+        span = Span(
+            name=name,
+            category=category,
+            span_id=os.urandom(8).hex(),
+            parent_id=self._stack[-1].span_id if self._stack else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        self._stack.append(span)
+        return span
+
+    def _finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        self._stack.pop()
+        self._buffer.append(span)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered spans to the trace file."""
+        if not self._buffer:
+            return
+        if self._writer is None:
+            self._open()
+        assert self._writer is not None
+        self._writer.write(self._buffer)
+        self._buffer = []
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        if self.trace_format == "chrome":
+            self._writer = ChromeTraceWriter(self._file, os.getpid())
+        else:
+            self._writer = OtlpJsonWriter(self._file, self.trace_id, "pytest")
+
+    def close(self) -> None:
+        """Flush remaining spans and finalize the trace file."""
+        self.flush()
+        if self._writer is None:
+            self._open()
+        assert self._writer is not None and self._file is not None
+        self._writer.close()
+        self._file.close()
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(
+        self, item: pytest.Item
+    ) -> Generator[None, object, object]:
+        metadata = requirement_metadata(item)
+        if metadata is None:
+            return (yield)
+        attributes = {
+            "requirement.id": metadata["testcase_id"],
+            "test.nodeid": item.nodeid,
+        }
+        for key in ("component", "priority"):
+            if metadata.get(key) is not None:
+                attributes[f"requirement.{key}"] = metadata[key]
+        span = self._start(metadata["testcase_id"], "test", **attributes)
+        try:
+            return (yield)
+        finally:
+            span.attributes.setdefault("test.outcome", "passed")
+            span.error = span.attributes["test.outcome"] in ("failed", "error")
+            self._finish(span)
+
+    def _phase(self, name: str) -> Generator[None, None, None]:
+        if not self._stack:
+            yield
+            return
+        span = self._start(name, "phase")
+        try:
+            yield
+        except BaseException:
+            span.error = True
+            raise
+        finally:
+            self._finish(span)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_setup(self) -> Generator[None, None, None]:
+        return (yield from self._phase("setup"))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self) -> Generator[None, None, None]:
+        return (yield from self._phase("call"))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_teardown(self) -> Generator[None, None, None]:
+        return (yield from self._phase("teardown"))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(
+        self, fixturedef: pytest.FixtureDef[Any]
+    ) -> Generator[None, object, object]:
+        if not self._stack:
+            return (yield)
+        span = self._start(
+            f"fixture:{fixturedef.argname}", "fixture", scope=fixturedef.scope
+        )
+        try:
+            return (yield)
+        except BaseException:
+            span.error = True
+            raise
+        finally:
+            self._finish(span)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_makereport(self) -> Generator[None, pytest.TestReport, Any]:
+        report = yield
+        if self._stack and self._stack[0].category == "test":
+            attributes = self._stack[0].attributes
+            outcome = worst_outcome(
+                attributes.get("test.outcome"), report_outcome(report)
+            )
+            if outcome is not None:
+                attributes["test.outcome"] = outcome
+        return report
+
+    def pytest_sessionfinish(self) -> None:
+        self.close()
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        terminalreporter.write_sep("-", f"requirement trace: {self.path}")
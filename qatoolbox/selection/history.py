@@ -0,0 +1,105 @@
+"""Historical outcomes of requirement tests, kept in the pytest cache."""
+
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import pytest
+
+from qatoolbox.reporting.outcomes import OutcomeTracker, report_requirement
+
+HISTORY_CACHE_KEY = "qatoolbox/history"
+FAILED_CACHE_KEY = "qatoolbox/failed_requirements"
+
+
+@dataclass
+class RequirementRecord:
+    """Aggregated outcomes of one test case ID across sessions.
+
+    Attributes:
+        runs: Number of sessions in which the requirement ran
+        failures: Number of those sessions in which any of its tests failed
+        duration: Total runtime in seconds over all recorded sessions
+        priority: Last known priority of the requirement
+    """
+
+    runs: int = 0
+    failures: int = 0
+    duration: float = 0.0
+    priority: Optional[str] = None
+
+    @property
+    def average_duration(self) -> float:
+        return self.duration / self.runs if self.runs else 0.0
+
+
+def load_history(cache: pytest.Cache) -> dict[str, RequirementRecord]:
+    """Read requirement history from the pytest cache."""
+    raw = cache.get(HISTORY_CACHE_KEY, {})
+    return {testcase_id: RequirementRecord(**data) for testcase_id, data in raw.items()}
+
+
+def load_failed(cache: pytest.Cache) -> list[str]:
+    """Read the test case IDs that failed in their latest run."""
+    return cache.get(FAILED_CACHE_KEY, [])
+
+
+def save_history(cache: pytest.Cache, history: dict[str, RequirementRecord]) -> None:
+    """Write requirement history to the pytest cache."""
+    cache.set(
+        HISTORY_CACHE_KEY,
+        {testcase_id: asdict(record) for testcase_id, record in history.items()},
+    )
+
+
+class HistoryRecorder:
+    """Pytest plugin accumulating requirement outcomes into the cache.
+
+    Counters are updated per report and merged into the stored history once,
+    at the end of the session, together with the set of test case IDs that
+    failed in their latest run. With pytest-xdist only the controller records,
+    from the reports forwarded by the workers.
+    """
+
+    def __init__(self, cache: pytest.Cache) -> None:
+        self.cache = cache
+        self._durations: dict[str, float] = {}
+        self._failed: set[str] = set()
+        self._priorities: dict[str, Optional[str]] = {}
+        self._outcomes = OutcomeTracker()
+        self._pending_durations: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        requirement = report_requirement(report)
+        if requirement is None:
+            return
+        duration = self._pending_durations.pop(report.nodeid, 0.0) + report.duration
+        outcome = self._outcomes.update(report)
+        if outcome is None:
+            self._pending_durations[report.nodeid] = duration
+            return
+        # Skipped and xfailed tests did not run to completion, so they would
+        # look like near-free runs that never fail
+        if outcome in ("skipped", "xfailed"):
+            return
+        testcase_id = requirement["testcase_id"]
+        self._durations[testcase_id] = self._durations.get(testcase_id, 0.0) + duration
+        self._priorities[testcase_id] = requirement.get("priority")
+        if outcome in ("failed", "error"):
+            self._failed.add(testcase_id)
+
+    def pytest_sessionfinish(self) -> None:
+        if not self._durations:
+            return
+        history = load_history(self.cache)
+        for testcase_id, duration in self._durations.items():
+            record = history.setdefault(testcase_id, RequirementRecord())
+            record.runs += 1
+            record.failures += testcase_id in self._failed
+            record.duration += duration
+            record.priority = self._priorities[testcase_id]
+        save_history(self.cache, history)
+
+        # Like pytest's lastfailed, requirements that did not run keep their
+        # previous state
+        failed = set(load_failed(self.cache)).difference(self._durations)
+        self.cache.set(FAILED_CACHE_KEY, sorted(failed | self._failed))
@@ -0,0 +1,47 @@
+"""Lookup of collected test items by requirement test case ID."""
+
+from typing import Iterable
+
+import pytest
+
+from qatoolbox.markers.labeling import requirement_metadata
+
+
+class RequirementIndex:
+    """Map test case IDs to the collected items that implement them.
+
+    Building the index is a single pass over the collected items; resolving
+    ``k`` IDs afterwards costs ``O(k)`` lookups regardless of suite size.
+    Node IDs play no part, so the index survives tests being moved or renamed.
+    """
+
+    def __init__(self, items: Iterable[pytest.Item]) -> None:
+        self._items: dict[str, list[pytest.Item]] = {}
+        for item in items:
+            metadata = requirement_metadata(item)
+            if metadata is not None:
+                self._items.setdefault(metadata["testcase_id"], []).append(item)
+
+    def __contains__(self, testcase_id: object) -> bool:
+        return testcase_id in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def resolve(self, testcase_ids: Iterable[str]) -> list[pytest.Item]:
+        """Return the items of the given IDs, skipping IDs no longer collected."""
+        resolved = []
+        for testcase_id in testcase_ids:
+            resolved.extend(self._items.get(testcase_id, ()))
+        return resolved
+
+
+def keep_items(
+    config: pytest.Config, items: list[pytest.Item], selected: Iterable[pytest.Item]
+) -> None:
+    """Deselect every item not in ``selected``, preserving collection order."""
+    keep = {id(item) for item in selected}
+    deselected = [item for item in items if id(item) not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if id(item) in keep]
@@ -0,0 +1,49 @@
+"""Rerun of the requirements that failed in their latest run.
+
+Unlike pytest's ``--lf``, which is keyed on node IDs, failures are stored by
+test case ID, so reruns still find tests that were moved or renamed.
+"""
+
+from typing import Optional
+
+import pytest
+
+from qatoolbox.selection.history import load_failed
+from qatoolbox.selection.index import RequirementIndex, keep_items
+
+
+class FailedRequirementsSelector:
+    """Pytest plugin deselecting all but the previously failed requirements.
+
+    If no failures are recorded, or none of them is collected any more, the
+    whole collection runs, as with pytest's ``--lf``.
+    """
+
+    def __init__(self, cache: pytest.Cache) -> None:
+        self.cache = cache
+        self.status: Optional[str] = None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        failed = load_failed(self.cache)
+        if not failed:
+            self.status = "no previously failed requirements, running all tests"
+            return
+        index = RequirementIndex(items)
+        selected = index.resolve(failed)
+        if not selected:
+            self.status = (
+                f"none of the {len(failed)} previously failed requirements were "
+                "collected, running all tests"
+            )
+            return
+        found = sum(testcase_id in index for testcase_id in failed)
+        self.status = f"rerunning {found} previously failed requirements"
+        keep_items(config, items, selected)
+
+    def pytest_report_collectionfinish(self) -> Optional[str]:
+        if self.status is None:
+            return None
+        return f"run-failed-requirements: {self.status}"
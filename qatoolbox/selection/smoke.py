@@ -0,0 +1,158 @@
+"""Smoke subset selection from requirement history.
+
+The subset is chosen to maximize the expected number of detected regressions
+within a runtime budget: each requirement is worth its (smoothed) historical
+failure rate weighted by priority, and costs its average runtime. This is a
+0/1 knapsack, solved greedily by value density.
+"""
+
+from pathlib import Path
+from typing import Iterable, Mapping, Optional
+
+import pytest
+
+from qatoolbox.selection.history import RequirementRecord
+from qatoolbox.selection.index import RequirementIndex, keep_items
+
+DEFAULT_PRIORITY_WEIGHTS = {"critical": 8.0, "high": 4.0, "medium": 2.0, "low": 1.0}
+
+# Lower bound on test cost, so that near-instant tests do not dominate
+_MIN_DURATION = 0.001
+
+
+def parse_priority_weights(lines: Iterable[str]) -> dict[str, float]:
+    """Parse ``priority=weight`` lines into a weight table.
+
+    Args:
+        lines: Lines such as ``critical=8``; empty input gives the defaults
+
+    Returns:
+        dict[str, float]: Weight for each priority
+
+    Raises:
+        ValueError: If a line is not a valid ``priority=weight`` pair
+    """
+    weights = {}
+    for line in lines:
+        priority, separator, weight = line.partition("=")
+        if not separator:
+            raise ValueError(f"Expected 'priority=weight', got {line!r}")
+        weights[priority.strip()] = float(weight)
+    return weights or dict(DEFAULT_PRIORITY_WEIGHTS)
+
+
+def requirement_value(record: RequirementRecord, weights: Mapping[str, float]) -> float:
+    """Expected, priority-weighted failure detection of a requirement.
+
+    The failure rate uses a Laplace estimate so that requirements which have
+    never failed still carry a small value that shrinks as they keep passing.
+    """
+    failure_rate = (record.failures + 1) / (record.runs + 2)
+    return failure_rate * weights.get(record.priority or "", 1.0)
+
+
+def select_smoke_subset(
+    history: Mapping[str, RequirementRecord],
+    budget: float,
+    weights: Mapping[str, float],
+) -> list[str]:
+    """Choose the requirements that best detect failures within a time budget.
+
+    Args:
+        history: Recorded outcomes per test case ID
+        budget: Maximum total runtime in seconds
+        weights: Value multiplier per priority
+
+    Returns:
+        list[str]: Selected test case IDs, most valuable per second first
+    """
+    candidates = []
+    for testcase_id, record in history.items():
+        if not record.runs:
+            continue
+        cost = max(record.average_duration, _MIN_DURATION)
+        candidates.append((requirement_value(record, weights), cost, testcase_id))
+    candidates.sort(key=lambda candidate: (-candidate[0] / candidate[1], candidate[2]))
+
+    selected, spent, value = [], 0.0, 0.0
+    for candidate_value, cost, testcase_id in candidates:
+        if spent + cost <= budget:
+            selected.append(testcase_id)
+            spent += cost
+            value += candidate_value
+
+    # The density greedy alone can be arbitrarily bad when one expensive
+    # requirement outweighs everything picked; taking the better of the two
+    # guarantees at least half of the optimal value.
+    affordable = [candidate for candidate in candidates if candidate[1] <= budget]
+    if affordable:
+        best = max(affordable, key=lambda candidate: candidate[0])
+        if best[0] > value:
+            return [best[2]]
+    return selected
+
+
+def write_selection(
+    path: Path, testcase_ids: list[str], history: Mapping[str, RequirementRecord]
+) -> None:
+    """Write a selection file, one test case ID per line."""
+    estimate = sum(
+        history[testcase_id].average_duration for testcase_id in testcase_ids
+    )
+    lines = [
+        f"# qatoolbox smoke subset: {len(testcase_ids)} requirements, "
+        f"estimated {estimate:.1f}s",
+        *testcase_ids,
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def read_selection(path: Path) -> frozenset[str]:
+    """Read test case IDs from a selection file, ignoring comments."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return frozenset(
+        line.strip() for line in lines if line.strip() and not line.startswith("#")
+    )
+
+
+class SmokeSelector:
+    """Pytest plugin deselecting tests outside a smoke selection file.
+
+    IDs that are no longer collected are listed in the collection summary. If
+    none of them is collected, the selection is stale and the run fails with a
+    usage error instead of deselecting every test.
+
+    Raises:
+        ValueError: If the selection is empty, which would deselect every test
+    """
+
+    def __init__(self, testcase_ids: frozenset[str]) -> None:
+        if not testcase_ids:
+            raise ValueError("The smoke selection lists no test case IDs")
+        self.testcase_ids = testcase_ids
+        self.status: Optional[str] = None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        index = RequirementIndex(items)
+        missing = sorted(
+            testcase_id for testcase_id in self.testcase_ids if testcase_id not in index
+        )
+        if len(missing) == len(self.testcase_ids):
+            raise pytest.UsageError(
+                "None of the requirements in the smoke selection were collected: "
+                + ", ".join(missing)
+            )
+        found = len(self.testcase_ids) - len(missing)
+        self.status = f"running {found} of {len(self.testcase_ids)} requirements"
+        if missing:
+            self.status += f", not collected: {', '.join(missing)}"
+        keep_items(config, items, index.resolve(self.testcase_ids))
+
+    def pytest_report_collectionfinish(self) -> Optional[str]:
+        if self.status is None:
+            return None
+        return f"requirement-smoke: {self.status}"
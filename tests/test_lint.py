@@ -0,0 +1,174 @@
+"""Tests for the requirement lint command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from qatoolbox.cli import main
+from qatoolbox.internal.config import find_ini_options
+from qatoolbox.lint import lint_paths, scan_file
+from qatoolbox.markers.schema import RequirementSchema
+
+SAMPLE_TESTS = """
+from qatoolbox.markers import labeling
+from qatoolbox.markers.labeling import requirement
+
+
+@requirement("AUTH-001", priority="high", owner="qa")
+def test_valid():
+    pass
+
+
+@labeling.requirement("auth-2", priority="urgent")
+def test_invalid():
+    pass
+
+
+@requirement("AUTH-001")
+def test_duplicate():
+    pass
+
+
+@requirement(f"AUTH-{1:03}")
+def test_dynamic():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Create a small project with a requirement schema and sample tests."""
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.pytest.ini_options]\n"
+        "requirement_id_pattern = '[A-Z]+-\\d{3,}'\n"
+        "requirement_priorities = ['high', 'low']\n"
+    )
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_sample.py").write_text(SAMPLE_TESTS)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_scan_file_collects_usages(project: Path):
+    usages, violations = scan_file("tests/test_sample.py")
+    assert [usage.testcase_id for usage in usages] == [
+        "AUTH-001",
+        "auth-2",
+        "AUTH-001",
+    ]
+    assert usages[0].priority == "high"
+    assert usages[0].fields == ("owner",)
+    assert [violation.code for violation in violations] == ["dynamic-id"]
+
+
+def test_scan_file_ignores_inplace(tmp_path: Path):
+    source = tmp_path / "test_inplace.py"
+    source.write_text(
+        "@requirement('TC-001', inplace=True, owner='qa')\ndef test_ok():\n    pass\n"
+    )
+    usages, _ = scan_file(str(source))
+    assert usages[0].fields == ("owner",)
+    schema = RequirementSchema.compile("", [], ["owner"])
+    assert lint_paths([str(source)], schema) == []
+
+
+def test_scan_file_syntax_error(tmp_path: Path):
+    broken = tmp_path / "test_broken.py"
+    broken.write_text("def test(:\n")
+    usages, violations = scan_file(str(broken))
+    assert usages == []
+    assert violations[0].code == "parse-error"
+
+
+def test_find_ini_options_from_pyproject(project: Path):
+    options = find_ini_options(project / "tests")
+    assert options["requirement_priorities"] == ["high", "low"]
+
+
+def test_find_ini_options_from_pytest_ini(tmp_path: Path):
+    (tmp_path / "pytest.ini").write_text(
+        "[pytest]\nrequirement_priorities =\n    high\n    low\n"
+    )
+    schema = RequirementSchema.from_ini_options(find_ini_options(tmp_path))
+    assert schema.priorities == frozenset({"high", "low"})
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lint_paths(project: Path, monkeypatch: MonkeyPatch, jobs: int):
+    monkeypatch.setattr("qatoolbox.lint._PARALLEL_THRESHOLD", 0)
+    schema = RequirementSchema.from_ini_options(find_ini_options(project))
+    violations = lint_paths(["tests"], schema, jobs=jobs)
+    assert [(violation.line, violation.code) for violation in violations] == [
+        (11, "invalid-id"),
+        (11, "invalid-priority"),
+        (16, "duplicate-id"),
+        (21, "dynamic-id"),
+    ]
+
+
+def test_cli_lint_json(project: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["lint", "--format", "json"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert {entry["code"] for entry in report} == {
+        "invalid-id",
+        "invalid-priority",
+        "duplicate-id",
+        "dynamic-id",
+    }
+    assert all(entry["path"].endswith("test_sample.py") for entry in report)
+
+
+def test_cli_lint_clean(tmp_path: Path, monkeypatch: MonkeyPatch):
+    (tmp_path / "test_ok.py").write_text(
+        "@requirement('TC-001')\ndef test_ok():\n    pass\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    assert main(["lint"]) == 0
+
+
+def test_cli_lint_invalid_config(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    config = tmp_path / "pytest.ini"
+    config.write_text("[pytest]\nrequirement_id_pattern = [A-Z\n")
+    assert main(["lint", "--config", str(config), str(tmp_path)]) == 2
+    assert "Invalid requirement ID pattern" in capsys.readouterr().err
+
+
+def test_cli_lint_missing_path(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["lint", str(tmp_path / "nonexistent_dir")]) == 2
+    assert "qatoolbox: error: No such file or directory" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("name", ["nope.toml", "nope.ini"])
+def test_cli_lint_missing_config(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], name: str
+):
+    assert main(["lint", "--config", str(tmp_path / name), str(tmp_path)]) == 2
+    assert "qatoolbox: error: Configuration file not found" in capsys.readouterr().err
+
+
+def test_cli_lint_malformed_config(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    config = tmp_path / "pyproject.toml"
+    config.write_text("[tool.pytest.ini_options\n")
+    assert main(["lint", "--config", str(config), str(tmp_path)]) == 2
+    assert f"qatoolbox: error: Cannot read {config}" in capsys.readouterr().err
+
+
+def test_cli_lint_config_from_paths(
+    project: Path, monkeypatch: MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    monkeypatch.chdir(project.parent)
+    assert main(["lint", str(project / "tests")]) == 1
+    assert "[invalid-id]" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1"])
+def test_cli_lint_invalid_jobs(
+    project: Path, capsys: pytest.CaptureFixture[str], jobs: str
+):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["lint", "--jobs", jobs])
+    assert excinfo.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
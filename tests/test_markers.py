@@ -7,7 +7,7 @@ import pytest
 from pytest import MonkeyPatch
 
 from qatoolbox.internal.errors import ToolboxInvalidTestError
-from qatoolbox.markers.labeling import requirement
+from qatoolbox.markers.labeling import requirement, set_inplace_default
 
 
 class TestRequirementDecorator:
@@ -568,3 +568,108 @@ class TestRequirementDecoratorExecution:
         for test_func in [test_payment_1, test_payment_2]:
             assert hasattr(test_func, "_qatoolbox_metadata")
             assert test_func._qatoolbox_metadata["component"] == "payment"
+
+
+class TestRequirementDecoratorFields:
+    """Test extra metadata fields and the pytest marker bridge."""
+
+    def test_extra_fields_are_stored(self):
+        """Test that arbitrary extra fields are stored with the metadata."""
+
+        @requirement(
+            "TC400",
+            priority="high",
+            tags=["smoke", "login"],
+            owner="qa-team",
+            ticket="JIRA-123",
+        )
+        def test_extra_fields():
+            assert True
+
+        metadata = test_extra_fields._qatoolbox_metadata
+        assert metadata["tags"] == ["smoke", "login"]
+        assert metadata["owner"] == "qa-team"
+        assert metadata["ticket"] == "JIRA-123"
+
+    def test_extra_fields_are_printed(self, capsys: pytest.CaptureFixture[str]):
+        """Test that extra fields are printed in the metadata banner."""
+
+        @requirement("TC401", risk_level="high")
+        def test_printed_fields():
+            pass
+
+        test_printed_fields()
+        assert "Risk level: high" in capsys.readouterr().out
+
+    def test_requirement_marker_is_attached(self):
+        """Test that a pytest requirement marker carries the metadata."""
+
+        @requirement("TC402", priority="low", component="api", owner="bob")
+        def test_marked():
+            assert True
+
+        (mark,) = [m for m in test_marked.pytestmark if m.name == "requirement"]
+        assert mark.args == ("TC402",)
+        assert mark.kwargs["priority"] == "low"
+        assert mark.kwargs["component"] == "api"
+        assert mark.kwargs["owner"] == "bob"
+
+    def test_requirement_marker_keeps_existing_marks(self):
+        """Test that marks applied below the decorator are preserved."""
+
+        @requirement("TC403")
+        @pytest.mark.slow
+        def test_stacked():
+            assert True
+
+        names = [mark.name for mark in test_stacked.pytestmark]
+        assert names == ["slow", "requirement"]
+
+
+class TestRequirementDecoratorInPlace:
+    """Test the in place (wrapper-free) mode of the requirement decorator."""
+
+    def test_inplace_returns_original_function(self):
+        """Test that in place mode does not wrap the function."""
+
+        def test_original():
+            return "result"
+
+        decorated = requirement("TC500", priority="high", inplace=True)(test_original)
+
+        assert decorated is test_original
+        assert not hasattr(decorated, "__wrapped__")
+        assert decorated._qatoolbox_metadata["testcase_id"] == "TC500"
+        assert decorated._qatoolbox_metadata["priority"] == "high"
+        assert [mark.name for mark in decorated.pytestmark] == ["requirement"]
+
+    def test_inplace_does_not_print_when_called(
+        self, capsys: pytest.CaptureFixture[str]
+    ):
+        """Test that the banner is left to the pytest hooks in place mode."""
+
+        @requirement("TC501", inplace=True)
+        def test_silent():
+            return "result"
+
+        assert test_silent() == "result"
+        assert capsys.readouterr().out == ""
+
+    def test_inplace_default(self):
+        """Test that the project default applies when inplace is not given."""
+        previous = set_inplace_default(True)
+        try:
+
+            @requirement("TC502")
+            def test_default():
+                pass
+
+            @requirement("TC503", inplace=False)
+            def test_wrapped():
+                pass
+
+        finally:
+            set_inplace_default(previous)
+
+        assert not hasattr(test_default, "__wrapped__")
+        assert hasattr(test_wrapped, "__wrapped__")
@@ -0,0 +1,110 @@
+"""Tests for the qatoolbox pytest plugin."""
+
+import tomllib
+from pathlib import Path
+
+import pytest
+from pytest import Pytester
+
+from tests.utils import PLUGIN_ARGS
+
+
+def test_plugin_entry_point():
+    pyproject = Path(__file__).parents[1] / "pyproject.toml"
+    with pyproject.open("rb") as file:
+        entry_points = tomllib.load(file)["project"]["entry-points"]
+    assert entry_points["pytest11"] == {"qatoolbox": "qatoolbox.plugin"}
+
+
+def test_requirement_marker_is_registered(pytester: Pytester):
+    result = pytester.runpytest(*PLUGIN_ARGS, "--markers")
+    result.stdout.fnmatch_lines(["@pytest.mark.requirement(testcase_id, **metadata)*"])
+
+
+def test_requirement_marker_selection(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001", priority="high", component="auth")
+        def test_high():
+            pass
+
+        @requirement("TC-002", priority="low", component="auth")
+        def test_low():
+            pass
+        """
+    )
+    result = pytester.runpytest(
+        *PLUGIN_ARGS,
+        "--strict-markers",
+        "-m",
+        "requirement(priority='high')",
+    )
+    result.assert_outcomes(passed=1, deselected=1)
+
+
+def test_schema_from_ini(pytester: Pytester):
+    pytester.makeini(
+        r"""
+        [pytest]
+        requirement_id_pattern = [A-Z]+-\d{3,}
+        requirement_priorities =
+            high
+            low
+        """
+    )
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("tc1", priority="high")
+        def test_bad_id():
+            pass
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS)
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*Test case ID 'tc1' does not match pattern*"])
+
+
+def test_invalid_schema_is_usage_error(pytester: Pytester):
+    pytester.makeini(
+        """
+        [pytest]
+        requirement_id_pattern = [A-Z
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS)
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*Invalid requirement ID pattern*"])
+
+
+def test_inplace_banner_printed_by_hook(pytester: Pytester):
+    pytester.makeini(
+        """
+        [pytest]
+        requirement_inplace = true
+        """
+    )
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001", priority="high")
+        def test_inplace():
+            assert not hasattr(test_inplace, "__wrapped__")
+
+        @requirement("TC-002")
+        def test_failing():
+            assert 1 == 2
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS, "-s")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        ["TEST CASE: TC-001", "Priority: high", "Function: test_inplace"]
+    )
+    # The failure traceback points straight at the test, with no wrapper frame
+    result.stdout.no_fnmatch_line("*in wrapper*")
+    result.stdout.fnmatch_lines(["E       assert 1 == 2"])
@@ -0,0 +1,153 @@
+"""Tests for the requirement progress server."""
+
+import json
+import socket
+from typing import BinaryIO, Iterator
+
+import pytest
+from pytest import Pytester
+
+from qatoolbox.reporting.outcomes import OutcomeTracker, worst_outcome
+from qatoolbox.reporting.progress import ProgressServer
+from tests.utils import PLUGIN_ARGS
+
+
+@pytest.fixture
+def server() -> Iterator[ProgressServer]:
+    """Start a progress server on a free local port."""
+    progress = ProgressServer("127.0.0.1:0")
+    progress.start()
+    yield progress
+    progress.stop()
+
+
+def _request(address: str, path: str) -> socket.socket:
+    host, port = address.removeprefix("http://").split(":")
+    connection = socket.create_connection((host, int(port)), timeout=5)
+    connection.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    return connection
+
+
+def _read_events(stream: BinaryIO, count: int) -> list[tuple[str, dict]]:
+    events, name = [], ""
+    while len(events) < count:
+        line = stream.readline().decode()
+        assert line, "stream closed early"
+        if line.startswith("event: "):
+            name = line.removeprefix("event: ").strip()
+        elif line.startswith("data: "):
+            events.append((name, json.loads(line.removeprefix("data: "))))
+    return events
+
+
+def test_worst_outcome():
+    assert worst_outcome(None, "passed") == "passed"
+    assert worst_outcome("passed", "error") == "error"
+    assert worst_outcome("failed", "skipped") == "failed"
+
+
+def test_outcome_tracker():
+    def report(nodeid: str, when: str, outcome: str) -> pytest.TestReport:
+        return pytest.TestReport(nodeid, ("t.py", 0, nodeid), {}, outcome, None, when)
+
+    tracker = OutcomeTracker()
+    assert tracker.update(report("a", "setup", "passed")) is None
+    assert tracker.update(report("b", "setup", "passed")) is None
+    assert tracker.update(report("a", "call", "failed")) is None
+    assert tracker.update(report("b", "call", "passed")) is None
+    assert tracker.update(report("b", "teardown", "passed")) == "passed"
+    assert tracker.update(report("a", "teardown", "passed")) == "failed"
+    assert tracker.update(report("c", "setup", "skipped")) is None
+    assert tracker.update(report("c", "teardown", "passed")) == "skipped"
+
+
+def test_status_endpoint(server: ProgressServer):
+    server.publish({"type": "start", "testcase_id": "TC-001"})
+    server.publish(
+        {
+            "type": "finish",
+            "testcase_id": "TC-001",
+            "component": "auth",
+            "priority": "high",
+            "outcome": "passed",
+        }
+    )
+    with _request(server.address, "/status") as connection:
+        response = connection.makefile("rb").read().decode()
+    assert response.startswith("HTTP/1.1 200 OK")
+    status = json.loads(response.split("\r\n\r\n", 1)[1])
+    assert status["started"] == 1
+    assert status["finished"] == 1
+    assert status["components"] == {"auth": {"passed": 1}}
+    assert status["priorities"] == {"high": {"passed": 1}}
+
+
+def test_unknown_path(server: ProgressServer):
+    with _request(server.address, "/nope") as connection:
+        assert connection.makefile("rb").readline().startswith(b"HTTP/1.1 404")
+
+
+def test_event_stream(server: ProgressServer):
+    with _request(server.address, "/events") as connection:
+        stream = connection.makefile("rb")
+        ((name, status),) = _read_events(stream, 1)
+        assert name == "status"
+        assert status["started"] == 0
+
+        server.publish({"type": "start", "testcase_id": "TC-001"})
+        ((name, event),) = _read_events(stream, 1)
+        assert name == "start"
+        assert event["testcase_id"] == "TC-001"
+
+
+def test_invalid_address(pytester: Pytester):
+    result = pytester.runpytest(
+        *PLUGIN_ARGS, "--requirement-progress", "127.0.0.1:notaport"
+    )
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+
+
+def test_progress_plugin(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        import json
+        import socket
+
+        import pytest
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001", priority="high", component="auth")
+        def test_first():
+            pass
+
+        @requirement("TC-002", priority="low", component="auth")
+        def test_second():
+            pytest.skip("not today")
+
+        def test_status(request):
+            reporter = request.config.pluginmanager.get_plugin("qatoolbox-progress")
+            host, port = reporter.server.address.removeprefix("http://").split(":")
+            with socket.create_connection((host, int(port)), timeout=5) as conn:
+                conn.sendall(b"GET /status HTTP/1.1\\r\\n\\r\\n")
+                body = conn.makefile("rb").read().split(b"\\r\\n\\r\\n", 1)[1]
+            status = json.loads(body)
+            assert status["finished"] == 2
+            assert status["components"] == {"auth": {"passed": 1, "skipped": 1}}
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-progress", "127.0.0.1:0")
+    result.assert_outcomes(passed=2, skipped=1)
+    result.stdout.fnmatch_lines(["requirement progress: http://127.0.0.1:*"])
+
+
+def test_unix_socket(tmp_path):
+    path = tmp_path / "progress.sock"
+    progress = ProgressServer(f"unix:{path}")
+    try:
+        assert progress.start() == f"unix:{path}"
+        with socket.socket(socket.AF_UNIX) as connection:
+            connection.connect(str(path))
+            connection.sendall(b"GET /status HTTP/1.1\r\n\r\n")
+            assert connection.makefile("rb").readline().startswith(b"HTTP/1.1 200")
+    finally:
+        progress.stop()
@@ -0,0 +1,108 @@
+"""Tests for rerunning failed requirements by test case ID."""
+
+import pytest
+from pytest import Pytester
+
+from tests.utils import PLUGIN_ARGS
+
+
+def test_rerun_survives_renames(pytester: Pytester):
+    pytester.makepyfile(
+        test_original="""
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001")
+        def test_passing():
+            pass
+
+        @requirement("TC-002")
+        def test_failing():
+            assert False
+        """
+    )
+    pytester.runpytest(*PLUGIN_ARGS).assert_outcomes(passed=1, failed=1)
+
+    # Move and rename the failing test; its node ID changes, its test case ID does not
+    (pytester.path / "test_original.py").unlink()
+    pytester.makepyfile(
+        test_moved="""
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001")
+        def test_passing():
+            pass
+
+        @requirement("TC-002")
+        def test_renamed():
+            pass
+
+        def test_plain():
+            pass
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS, "--rerun-failed-requirements", "-v")
+    result.assert_outcomes(passed=1, deselected=2)
+    result.stdout.fnmatch_lines(
+        [
+            "run-failed-requirements: rerunning 1 previously failed requirements",
+            "*test_moved.py::test_renamed PASSED*",
+        ]
+    )
+
+    # Once it passes, the requirement is no longer recorded as failed
+    result = pytester.runpytest(*PLUGIN_ARGS, "--rerun-failed-requirements")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*no previously failed requirements*"])
+
+
+def test_rerun_keeps_failures_that_did_not_run(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001")
+        def test_first():
+            assert False
+
+        @requirement("TC-002")
+        def test_second():
+            assert False
+        """
+    )
+    pytester.runpytest(*PLUGIN_ARGS).assert_outcomes(failed=2)
+    pytester.runpytest(*PLUGIN_ARGS, "-k", "first").assert_outcomes(
+        failed=1, deselected=1
+    )
+    assert (
+        pytester.path.joinpath(".pytest_cache", "v", "qatoolbox", "failed_requirements")
+        .read_text()
+        .count("TC-")
+        == 2
+    )
+
+
+def test_rerun_with_uncollected_failures(pytester: Pytester):
+    test_file = pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-GONE")
+        def test_failing():
+            assert False
+        """
+    )
+    pytester.runpytest(*PLUGIN_ARGS).assert_outcomes(failed=1)
+    test_file.write_text("def test_other():\n    pass\n")
+    result = pytester.runpytest(*PLUGIN_ARGS, "--rerun-failed-requirements")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*none of the 1 previously failed*running all tests"])
+
+
+@pytest.mark.parametrize(
+    "option", ["--rerun-failed-requirements", "--requirement-smoke-generate=a.txt"]
+)
+def test_cache_options_need_cacheprovider(pytester: Pytester, option: str):
+    pytester.makepyfile("def test_plain():\n    pass\n")
+    result = pytester.runpytest(*PLUGIN_ARGS, "-p", "no:cacheprovider", option)
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*needs the cacheprovider plugin*"])
@@ -0,0 +1,132 @@
+"""Tests for requirement resource sampling."""
+
+import json
+
+import pytest
+from pytest import Pytester
+
+from qatoolbox.reporting.resources import (
+    ResourceMonitor,
+    ResourceSample,
+    ResourceSampler,
+    ResourceUsage,
+)
+from tests.utils import PLUGIN_ARGS
+
+
+def test_sampler_reports_usage():
+    sampler = ResourceSampler()
+    try:
+        sample = sampler.sample()
+    finally:
+        sampler.close()
+    assert sample.rss > 0
+    assert sample.cpu_time > 0
+    assert sample.open_fds >= 0
+
+
+def test_sampler_detects_open_descriptors(tmp_path):
+    sampler = ResourceSampler()
+    before = sampler.sample()
+    files = [open(tmp_path / f"file{index}", "w") for index in range(3)]
+    after = sampler.sample()
+    for file in files:
+        file.close()
+    sampler.close()
+    assert after.open_fds - before.open_fds == 3
+
+
+def test_usage_accumulates_deltas():
+    usage = ResourceUsage("TC-001")
+    usage.add(ResourceSample(100, 1.0, 5), ResourceSample(300, 1.5, 6))
+    usage.add(ResourceSample(300, 1.5, 6), ResourceSample(200, 2.0, 6))
+    assert usage.runs == 2
+    assert usage.rss_delta == 100
+    assert usage.cpu_time == 1.0
+    assert usage.fd_delta == 1
+
+
+class _Terminal:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write_sep(self, sep: str, title: str) -> None:
+        self.lines.append(title)
+
+    def write_line(self, line: str) -> None:
+        self.lines.append(line)
+
+
+def test_descriptor_leak_not_hidden_by_rss_growth():
+    monitor = ResourceMonitor(top=1)
+    monitor.usage = {
+        "TC-NOISE": ResourceUsage("TC-NOISE", runs=1, rss_delta=4096),
+        "TC-FDS": ResourceUsage("TC-FDS", runs=1, fd_delta=30),
+    }
+    assert monitor.leak_report("fd_delta")[0].testcase_id == "TC-FDS"
+    terminal = _Terminal()
+    monitor.pytest_terminal_summary(terminal)
+    assert any(line.startswith("TC-FDS ") for line in terminal.lines)
+    assert any(line.startswith("TC-NOISE ") for line in terminal.lines)
+
+
+def test_leak_report(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        leaked = []
+
+        @requirement("TC-LEAK")
+        def test_leaks_descriptor(tmp_path):
+            leaked.append(open(tmp_path / "leak", "w"))
+
+        @requirement("TC-CLEAN")
+        def test_clean():
+            pass
+
+        def test_unsampled():
+            pass
+        """
+    )
+    result = pytester.runpytest(
+        *PLUGIN_ARGS, "--requirement-resources-json", "leaks.json"
+    )
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*requirement resource growth*", "TC-LEAK *"])
+
+    report = json.loads((pytester.path / "leaks.json").read_text())
+    by_id = {entry["testcase_id"]: entry for entry in report}
+    assert set(by_id) == {"TC-LEAK", "TC-CLEAN"}
+    assert by_id["TC-LEAK"]["fd_delta"] == 1
+    assert by_id["TC-CLEAN"]["fd_delta"] == 0
+
+
+def test_leak_report_with_xdist(pytester: Pytester):
+    pytest.importorskip("xdist")
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        leaked = []
+
+        @requirement("TC-LEAK")
+        def test_leaks_descriptor(tmp_path):
+            leaked.append(open(tmp_path / "leak", "w"))
+
+        @requirement("TC-CLEAN")
+        def test_clean():
+            pass
+        """
+    )
+    result = pytester.runpytest(
+        *PLUGIN_ARGS, "-n", "2", "--requirement-resources-json", "leaks.json"
+    )
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*requirement resource growth*", "TC-LEAK *"])
+
+    report = json.loads((pytester.path / "leaks.json").read_text())
+    by_id = {entry["testcase_id"]: entry for entry in report}
+    assert set(by_id) == {"TC-LEAK", "TC-CLEAN"}
+    assert by_id["TC-LEAK"]["fd_delta"] == 1
+    assert not list(pytester.path.glob("leaks.*.json"))
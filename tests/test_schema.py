@@ -0,0 +1,77 @@
+"""Unit tests for the requirement metadata schema."""
+
+from typing import Iterator
+
+import pytest
+
+from qatoolbox.internal.errors import ToolboxInvalidTestError
+from qatoolbox.markers.labeling import requirement
+from qatoolbox.markers.schema import RequirementSchema, get_schema, set_schema
+
+
+@pytest.fixture
+def strict_schema() -> Iterator[RequirementSchema]:
+    """Install a restrictive schema for the duration of a test."""
+    schema = RequirementSchema.compile(
+        r"[A-Z]+-\d{3,}", ["low", "medium", "high"], ["owner", "tags"]
+    )
+    previous = set_schema(schema)
+    yield schema
+    set_schema(previous)
+
+
+def test_default_schema_accepts_anything():
+    schema = RequirementSchema()
+    schema.validate("any id", "whatever", {"custom": 1})
+
+
+def test_compile_empty_values_disable_checks():
+    schema = RequirementSchema.compile("", [], [])
+    assert schema == RequirementSchema()
+
+
+def test_compile_invalid_pattern():
+    with pytest.raises(ToolboxInvalidTestError, match="Invalid requirement ID pattern"):
+        RequirementSchema.compile("[A-Z")
+
+
+@pytest.mark.parametrize("testcase_id", ["AUTH-001", "PAY-1234"])
+def test_validate_matching_id(strict_schema: RequirementSchema, testcase_id: str):
+    strict_schema.validate(testcase_id)
+
+
+@pytest.mark.parametrize("testcase_id", ["auth-001", "AUTH-01", "AUTH-001x"])
+def test_validate_rejects_id(strict_schema: RequirementSchema, testcase_id: str):
+    with pytest.raises(ToolboxInvalidTestError, match="does not match pattern"):
+        strict_schema.validate(testcase_id)
+
+
+def test_validate_rejects_priority(strict_schema: RequirementSchema):
+    with pytest.raises(ToolboxInvalidTestError, match="Invalid priority 'P0'"):
+        strict_schema.validate("AUTH-001", "P0")
+
+
+def test_validate_rejects_unknown_field(strict_schema: RequirementSchema):
+    with pytest.raises(ToolboxInvalidTestError, match="Unknown requirement field"):
+        strict_schema.validate("AUTH-001", "high", {"owner": "qa", "risk": "high"})
+
+
+def test_set_schema_returns_previous(strict_schema: RequirementSchema):
+    replacement = RequirementSchema()
+    assert set_schema(replacement) is strict_schema
+    assert get_schema() is replacement
+    set_schema(strict_schema)
+
+
+def test_requirement_validates_at_decoration(strict_schema: RequirementSchema):
+    with pytest.raises(ToolboxInvalidTestError, match="does not match pattern"):
+
+        @requirement("tc-1")
+        def test_invalid():
+            pass
+
+    @requirement("AUTH-001", priority="high", owner="qa")
+    def test_valid():
+        pass
+
+    assert test_valid._qatoolbox_metadata["owner"] == "qa"
@@ -0,0 +1,190 @@
+"""Tests for requirement history and smoke subset selection."""
+
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pytest import Pytester
+
+from qatoolbox.selection.history import RequirementRecord
+from qatoolbox.selection.smoke import (
+    DEFAULT_PRIORITY_WEIGHTS,
+    parse_priority_weights,
+    read_selection,
+    requirement_value,
+    select_smoke_subset,
+    write_selection,
+)
+from tests.utils import PLUGIN_ARGS
+
+
+def test_parse_priority_weights():
+    assert parse_priority_weights(["p0 = 10", "p1=2.5"]) == {"p0": 10.0, "p1": 2.5}
+    assert parse_priority_weights([]) == DEFAULT_PRIORITY_WEIGHTS
+
+
+def test_parse_priority_weights_invalid():
+    with pytest.raises(ValueError, match="priority=weight"):
+        parse_priority_weights(["high"])
+
+
+def test_requirement_value_weights_failures_and_priority():
+    flaky = RequirementRecord(runs=8, failures=3, duration=1.0, priority="low")
+    stable = RequirementRecord(runs=8, failures=0, duration=1.0, priority="low")
+    critical = RequirementRecord(runs=8, failures=0, duration=1.0, priority="critical")
+    weights = DEFAULT_PRIORITY_WEIGHTS
+    assert requirement_value(flaky, weights) > requirement_value(stable, weights)
+    assert requirement_value(critical, weights) > requirement_value(stable, weights)
+
+
+def test_select_prefers_failures_per_second():
+    history = {
+        "FAST-FLAKY": RequirementRecord(runs=10, failures=5, duration=10.0),
+        "SLOW-FLAKY": RequirementRecord(runs=10, failures=5, duration=500.0),
+        "FAST-STABLE": RequirementRecord(runs=10, failures=0, duration=10.0),
+        "NEVER-RAN": RequirementRecord(),
+    }
+    selected = select_smoke_subset(history, budget=2.5, weights={})
+    assert selected == ["FAST-FLAKY", "FAST-STABLE"]
+
+
+def test_select_respects_budget():
+    history = {
+        f"TC-{index:03}": RequirementRecord(runs=1, failures=1, duration=1.0)
+        for index in range(10)
+    }
+    assert len(select_smoke_subset(history, budget=3.5, weights={})) == 3
+
+
+def test_select_falls_back_to_best_single_requirement():
+    history = {
+        "CHEAP": RequirementRecord(runs=100, failures=0, duration=0.1),
+        "VALUABLE": RequirementRecord(
+            runs=1, failures=1, duration=10.0, priority="critical"
+        ),
+    }
+    weights = DEFAULT_PRIORITY_WEIGHTS
+    assert select_smoke_subset(history, budget=10.0, weights=weights) == ["VALUABLE"]
+
+
+def test_selection_file_round_trip(tmp_path: Path):
+    history = {"TC-001": RequirementRecord(runs=1, duration=2.0)}
+    path = tmp_path / "smoke.txt"
+    write_selection(path, ["TC-001"], history)
+    assert path.read_text().startswith("# qatoolbox smoke subset")
+    assert read_selection(path) == {"TC-001"}
+
+
+def test_smoke_workflow(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        import os
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001", priority="low")
+        def test_stable():
+            pass
+
+        @requirement("TC-002", priority="high")
+        def test_flaky():
+            assert not os.environ.get("BREAK")
+
+        def test_plain():
+            pass
+        """
+    )
+    pytester.runpytest(*PLUGIN_ARGS).assert_outcomes(passed=3)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("BREAK", "1")
+        pytester.runpytest(*PLUGIN_ARGS).assert_outcomes(passed=2, failed=1)
+
+    result = pytester.runpytest(
+        *PLUGIN_ARGS,
+        "--requirement-smoke-generate",
+        "smoke.txt",
+        "--requirement-smoke-budget",
+        "1",
+    )
+    assert result.ret == 0
+    result.stdout.fnmatch_lines(["*Selected * of 2 requirements*"])
+    assert "TC-002" in read_selection(pytester.path / "smoke.txt")
+
+    (pytester.path / "smoke.txt").write_text("TC-002\nTC-GONE\n")
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-smoke", "smoke.txt")
+    result.assert_outcomes(passed=1, deselected=2)
+    result.stdout.fnmatch_lines(
+        ["requirement-smoke: running 1 of 2 requirements, not collected: TC-GONE"]
+    )
+
+
+def test_history_ignores_skipped_requirements(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-SKIP")
+        @pytest.mark.skip(reason="not applicable")
+        def test_skipped():
+            pass
+
+        @requirement("TC-XFAIL")
+        @pytest.mark.xfail(reason="known bug")
+        def test_xfailed():
+            assert False
+
+        @requirement("TC-RUN")
+        def test_run():
+            pass
+        """
+    )
+    for _ in range(3):
+        pytester.runpytest(*PLUGIN_ARGS).assert_outcomes(passed=1, skipped=1, xfailed=1)
+    result = pytester.runpytest(
+        *PLUGIN_ARGS,
+        "--requirement-smoke-generate",
+        "smoke.txt",
+        "--requirement-smoke-budget",
+        "60",
+    )
+    result.stdout.fnmatch_lines(["*Selected 1 of 1 requirements*"])
+    assert read_selection(pytester.path / "smoke.txt") == {"TC-RUN"}
+
+
+def test_smoke_selection_stale(pytester: Pytester):
+    (pytester.path / "smoke.txt").write_text("TC-GONE\nTC-RENAMED\n")
+    pytester.makepyfile(
+        """
+        from qatoolbox.markers.labeling import requirement
+
+        @requirement("TC-001")
+        def test_one():
+            pass
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-smoke", "smoke.txt")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(
+        [
+            "*None of the requirements in the smoke selection were collected: "
+            "TC-GONE, TC-RENAMED*"
+        ]
+    )
+
+
+def test_smoke_generate_without_history(pytester: Pytester):
+    pytester.makepyfile("def test_plain():\n    pass\n")
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-smoke-generate", "a.txt")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*No requirement history recorded yet*"])
+    assert not (pytester.path / "a.txt").exists()
+
+
+@pytest.mark.parametrize("contents", [None, "# qatoolbox smoke subset\n"])
+def test_smoke_selection_unusable(pytester: Pytester, contents: Optional[str]):
+    if contents is not None:
+        (pytester.path / "smoke.txt").write_text(contents)
+    pytester.makepyfile("def test_plain():\n    pass\n")
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-smoke", "smoke.txt")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*Cannot use smoke selection smoke.txt*"])
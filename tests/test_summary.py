@@ -0,0 +1,86 @@
+"""Tests for the requirement session summary."""
+
+import json
+from collections import Counter
+
+from pytest import Pytester
+
+from qatoolbox.reporting.summary import pass_rate
+from tests.utils import PLUGIN_ARGS
+
+SUMMARY_TESTS = """
+import pytest
+from qatoolbox.markers.labeling import requirement
+
+@pytest.fixture
+def broken_teardown():
+    yield
+    raise RuntimeError("teardown failed")
+
+@requirement("TC-001", priority="high", component="auth")
+@pytest.mark.parametrize("value", [1, 2, 3])
+def test_auth(value):
+    assert value != 3
+
+@requirement("TC-002", priority="high", component="auth")
+def test_auth_teardown(broken_teardown):
+    pass
+
+@requirement("TC-003", priority="low", component="payment")
+def test_payment_skipped():
+    pytest.skip("not available")
+
+@requirement("TC-004", priority="low", component="payment")
+@pytest.mark.xfail(reason="known bug")
+def test_payment_xfail():
+    assert False
+
+@requirement("TC-005")
+def test_unassigned():
+    pass
+
+def test_not_a_requirement():
+    pass
+"""
+
+
+def test_pass_rate():
+    assert pass_rate(Counter(passed=3, failed=1, skipped=4)) == 0.75
+    assert pass_rate(Counter(passed=1, xfailed=1)) == 1.0
+    assert pass_rate(Counter(skipped=2)) is None
+
+
+def test_summary_table_and_json(pytester: Pytester):
+    pytester.makepyfile(SUMMARY_TESTS)
+    result = pytester.runpytest(
+        *PLUGIN_ARGS, "--requirement-summary-json", "summary.json"
+    )
+    result.assert_outcomes(passed=5, failed=1, errors=1, skipped=1, xfailed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*requirement summary*",
+            "Component * Priority * Total * Passed*Pass rate",
+            "- * - * 1 * 1 *100.0%",
+            "auth * high * 4 * 2 *50.0%",
+            "payment * low * 2 * 0 *n/a",
+            "TOTAL * 7 * 3 *",
+        ]
+    )
+
+    summary = json.loads((pytester.path / "summary.json").read_text())
+    groups = {
+        (group["component"], group["priority"]): group for group in summary["groups"]
+    }
+    assert groups[("auth", "high")]["outcomes"] == {
+        "passed": 2,
+        "failed": 1,
+        "error": 1,
+    }
+    assert groups[("payment", "low")]["outcomes"] == {"skipped": 1, "xfailed": 1}
+    assert summary["totals"]["total"] == 7
+
+
+def test_summary_disabled_by_default(pytester: Pytester):
+    pytester.makepyfile(SUMMARY_TESTS)
+    result = pytester.runpytest(*PLUGIN_ARGS)
+    result.stdout.no_fnmatch_line("*requirement summary*")
@@ -0,0 +1,159 @@
+"""Tests for requirement tracing spans."""
+
+import json
+
+import pytest
+from pytest import Pytester
+
+from qatoolbox.reporting.tracing import RequirementTracer
+from tests.utils import PLUGIN_ARGS
+
+TRACED_TESTS = """
+import pytest
+from qatoolbox.markers.labeling import requirement
+
+@pytest.fixture
+def resource():
+    yield "value"
+
+@requirement("TC-001", priority="high", component="auth")
+def test_passing(resource):
+    assert resource == "value"
+
+@requirement("TC-002", priority="low", component="auth")
+def test_failing():
+    assert False
+
+def test_untraced():
+    pass
+"""
+
+
+def test_chrome_trace(pytester: Pytester):
+    pytester.makepyfile(TRACED_TESTS)
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-trace", "trace.json")
+    result.assert_outcomes(passed=2, failed=1)
+
+    events = json.loads((pytester.path / "trace.json").read_text())
+    tests = {event["name"]: event for event in events if event["cat"] == "test"}
+    assert set(tests) == {"TC-001", "TC-002"}
+    assert tests["TC-001"]["args"]["test.outcome"] == "passed"
+    assert tests["TC-001"]["args"]["requirement.component"] == "auth"
+    assert tests["TC-002"]["args"]["test.outcome"] == "failed"
+
+    names = [event["name"] for event in events]
+    assert names.count("setup") == 2
+    assert names.count("call") == 2
+    assert "fixture:resource" in names
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+
+def test_trace_outcomes(pytester: Pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+        from qatoolbox.markers.labeling import requirement
+
+        @pytest.fixture
+        def broken():
+            raise RuntimeError("setup failed")
+
+        @requirement("TC-001")
+        @pytest.mark.xfail(reason="known bug")
+        def test_xfailed():
+            assert False
+
+        @requirement("TC-002")
+        @pytest.mark.xfail(reason="fixed since")
+        def test_xpassed():
+            pass
+
+        @requirement("TC-003")
+        @pytest.mark.skip(reason="not applicable")
+        def test_skipped():
+            pass
+
+        @requirement("TC-004")
+        def test_error(broken):
+            pass
+        """
+    )
+    result = pytester.runpytest(*PLUGIN_ARGS, "--requirement-trace", "trace.json")
+    result.assert_outcomes(xfailed=1, xpassed=1, skipped=1, errors=1)
+
+    events = json.loads((pytester.path / "trace.json").read_text())
+    outcomes = {
+        event["name"]: event["args"]["test.outcome"]
+        for event in events
+        if event["cat"] == "test"
+    }
+    assert outcomes == {
+        "TC-001": "xfailed",
+        "TC-002": "xpassed",
+        "TC-003": "skipped",
+        "TC-004": "error",
+    }
+
+
+def test_otlp_trace(pytester: Pytester):
+    pytester.makepyfile(TRACED_TESTS)
+    result = pytester.runpytest(
+        *PLUGIN_ARGS,
+        "--requirement-trace",
+        "trace.jsonl",
+        "--requirement-trace-format",
+        "otlp",
+    )
+    result.assert_outcomes(passed=2, failed=1)
+
+    lines = (pytester.path / "trace.jsonl").read_text().splitlines()
+    spans = [
+        span
+        for line in lines
+        for resource in json.loads(line)["resourceSpans"]
+        for scope in resource["scopeSpans"]
+        for span in scope["spans"]
+    ]
+    by_id = {span["spanId"]: span for span in spans}
+    roots = [span for span in spans if "parentSpanId" not in span]
+    assert sorted(span["name"] for span in roots) == ["TC-001", "TC-002"]
+    assert len({span["traceId"] for span in spans}) == 1
+
+    fixture = next(span for span in spans if span["name"] == "fixture:resource")
+    setup = by_id[fixture["parentSpanId"]]
+    assert setup["name"] == "setup"
+    assert by_id[setup["parentSpanId"]]["name"] == "TC-001"
+
+    failing = next(span for span in roots if span["name"] == "TC-002")
+    assert failing["status"]["code"] == 2
+
+
+def test_trace_batches(pytester: Pytester, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(RequirementTracer, "batch_size", 2)
+    pytester.makepyfile(TRACED_TESTS)
+    pytester.runpytest(
+        *PLUGIN_ARGS,
+        "--requirement-trace",
+        "trace.jsonl",
+        "--requirement-trace-format",
+        "otlp",
+    )
+    lines = (pytester.path / "trace.jsonl").read_text().splitlines()
+    assert len(lines) > 1
+
+
+def test_trace_disabled_by_default(pytester: Pytester):
+    config = pytester.parseconfigure(*PLUGIN_ARGS)
+    assert not config.pluginmanager.has_plugin("qatoolbox-tracer")
+
+
+def test_trace_written_by_xdist_workers_only(pytester: Pytester):
+    pytest.importorskip("xdist")
+    pytester.makepyfile(TRACED_TESTS)
+    result = pytester.runpytest(
+        *PLUGIN_ARGS, "-n", "2", "--requirement-trace", "trace.json"
+    )
+    result.assert_outcomes(passed=2, failed=1)
+    assert not (pytester.path / "trace.json").exists()
+    traces = sorted(path.name for path in pytester.path.glob("trace.*.json"))
+    assert traces == ["trace.gw0.json", "trace.gw1.json"]
@@ -0,0 +1,6 @@
+from importlib.metadata import entry_points
+
+# Installed copies load the plugin through its pytest11 entry point, while a
+# source checkout has to load it explicitly; loading it both ways fails.
+PLUGIN_AUTOLOADED = bool(entry_points(group="pytest11", name="qatoolbox"))
+PLUGIN_ARGS: tuple[str, ...] = () if PLUGIN_AUTOLOADED else ("-p", "qatoolbox.plugin")